@@ -1,3 +1,5 @@
+import logging
+
 from django.contrib import admin
 from django.contrib.admin import AdminSite
 from django.contrib.auth import get_user_model
@@ -20,6 +22,8 @@ from .roles import roles, TenancyRole
 
 import uuid
 
+logger = logging.getLogger(__name__)
+
 
 class TenantAdminSite(AdminSite):
     """
@@ -56,22 +60,19 @@ class TenantAdminSite(AdminSite):
         SECURITY: This is a critical permission check. The middleware should have
         already blocked unauthorized access, but we verify again here.
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         if not request.user.is_authenticated or not request.user.is_active:
-            logger.debug(f"User {request.user} denied: not authenticated or not active")
+            logger.debug("User %s denied: not authenticated or not active", request.user)
             return False
 
         # Get the tenant from request (set by middleware based on domain)
         tenant = getattr(request, 'tenant', None)
         if tenant is None:
-            logger.warning(f"User {request.user} denied: no tenant in request")
+            logger.warning("User %s denied: no tenant in request", request.user)
             return False
 
         # Tenant admins have access to ALL tenant admin sites
         if roles.is_tenant_admin(request.user):
-            logger.debug(f"Tenant admin {request.user} granted access to tenant admin site for {tenant}")
+            logger.debug("Tenant admin %s granted access to tenant admin site for %s", request.user, tenant)
             return True
 
         # For tenant managers, verify they have role for THIS SPECIFIC tenant
@@ -80,12 +81,12 @@ class TenantAdminSite(AdminSite):
 
         if not has_access:
             logger.warning(
-                f"User {request.user} denied access to {tenant} /manage/ - "
-                f"not a tenant manager for this tenant"
+                "User %s denied access to %s /manage/ - not a tenant manager for this tenant",
+                request.user, tenant,
             )
         else:
             logger.debug(
-                f"Tenant manager {request.user} granted access to {tenant} /manage/"
+                "Tenant manager %s granted access to %s /manage/", request.user, tenant,
             )
 
         return has_access
@@ -473,15 +474,17 @@ def create_tenant_user_admin():
 
         def get_queryset(self, request):
             qs = super(DynamicUserAdminBase, self).get_queryset(request)
-            if has_tenant and hasattr(request, 'tenant') and request.tenant:
-                return qs.filter(tenant=request.tenant)
+            tenant = getattr(request, 'tenant', None)
+            if has_tenant and tenant is not None:
+                return qs.filter(tenant=tenant)
             return qs
 
         def save_model(self, request, obj, form, change):
             if has_tenant and not change:
                 if not getattr(obj, 'tenant_id', None):
-                    if hasattr(request, 'tenant') and request.tenant:
-                        obj.tenant = request.tenant
+                    tenant = getattr(request, 'tenant', None)
+                    if tenant is not None:
+                        obj.tenant = tenant
             super().save_model(request, obj, form, change)
 
         def get_exclude(self, request, obj=None):
@@ -1,3 +1,5 @@
+import sys
+
 from django.db import models
 from .context import get_current_tenant
 from .warnings import warn_missing_tenant
@@ -24,7 +26,7 @@ class TenantQuerySet(models.QuerySet):
             tenant = get_current_tenant()
 
         if tenant is None:
-            warn_missing_tenant(self.model)
+            warn_missing_tenant(self.model, caller_frame=sys._getframe(1))
             return self.none()
 
         return self.filter(tenant=tenant)
@@ -57,14 +59,14 @@ class TenantQuerySet(models.QuerySet):
             return self
 
         # Check if this is a tenant model
-        if not hasattr(self.model, '_is_tenant_model') or not self.model._is_tenant_model():
+        if not getattr(self.model, '_is_tenant_model_flag', False):
             return self
 
         # Get current tenant
         current_tenant = get_current_tenant()
         if current_tenant is None:
             # No tenant context - return empty queryset for safety, but warn loudly
-            warn_missing_tenant(self.model)
+            warn_missing_tenant(self.model, caller_frame=sys._getframe(1))
             return self.none()
 
         # Check if already filtered by tenant
@@ -127,7 +129,7 @@ class TenantManager(models.Manager):
         """
         qs = TenantQuerySet(self.model, using=self._db)
         # Apply tenant filter immediately if this is a tenant model
-        if hasattr(self.model, '_is_tenant_model') and self.model._is_tenant_model():
+        if getattr(self.model, '_is_tenant_model_flag', False):
             return qs._apply_tenant_filter()
         return qs
 
@@ -1,13 +1,13 @@
 import logging
 
 from django.conf import settings
-from django.contrib.auth import logout
+from django.contrib.auth import get_user_model, logout
 from django.http import Http404, HttpResponse, HttpResponseNotFound
 from django.utils.deprecation import MiddlewareMixin
 
 from .context import clear_current_tenant, set_current_tenant
 from .models import Tenant
-from .roles import TenancyRole, roles
+from .roles import roles
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +36,6 @@ class RequestTenancyAccess:
     def can_authenticate_email(self, email: str):
         # Optional: if you’ve implemented can_identity_authenticate_on_tenant()
         # in tenancy/services_auth.py, you can delegate to it here.
-        from django.contrib.auth import get_user_model
-
         email_norm = (email or "").strip()
         if not email_norm or self.tenant is None:
             return False
@@ -69,9 +67,10 @@ class TenantMiddleware(MiddlewareMixin):
         # Extract hostname without port
         hostname = request.get_host().split(":")[0].lower()
 
-        logger.debug(f"Processing request for hostname: {hostname}")
-        logger.debug(f"Full host header: {request.get_host()}")
-        logger.debug(f"Request path: {request.path}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing request for hostname: %s", hostname)
+            logger.debug("Full host header: %s", request.get_host())
+            logger.debug("Request path: %s", request.path)
 
         # Allow super admin access without tenant resolution (bootstrap mode)
         # Crucial for:
@@ -84,7 +83,8 @@ class TenantMiddleware(MiddlewareMixin):
             for skip_path in skip_tenant_paths:
                 if request.path.startswith(skip_path):
                     logger.info(
-                        f"Path '{request.path}' matches skip pattern '{skip_path}', skipping tenant resolution"
+                        "Path '%s' matches skip pattern '%s', skipping tenant resolution",
+                        request.path, skip_path,
                     )
                     # Don't set a tenant, allow the request to proceed.
                     # Admin site's has_permission() will still check authentication/roles.
@@ -97,36 +97,43 @@ class TenantMiddleware(MiddlewareMixin):
             request.tenant = tenant
             request.tenancy = RequestTenancyAccess(request)
 
-            logger.info(f"Tenant '{tenant.name}' (domain: {hostname}) set for request")
+            logger.info("Tenant '%s' (domain: %s) set for request", tenant.name, hostname)
 
             # ------------------------------------------------------------------
             # GLOBAL MEMBERSHIP ENFORCEMENT (prevents "tenant manager logs into other tenant")
             # ------------------------------------------------------------------
             if request.user.is_authenticated and self._should_enforce_membership(request):
-                user_info = f"{request.user.username} (tenant: {getattr(request.user, 'tenant', 'N/A')})"
-                logger.info(
-                    f"Membership enforcement check - User: {user_info}, Request Tenant: {tenant.name}, Path: {request.path}"
-                )
+                # Reading user.tenant may query the database, so only do it if the
+                # line is going to be logged
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Membership enforcement check - User: %s (tenant: %s), Request Tenant: %s, Path: %s",
+                        request.user.username, getattr(request.user, 'tenant', 'N/A'),
+                        tenant.name, request.path,
+                    )
 
                 # Tenant admins can be authenticated on any tenant
                 if roles.is_tenant_admin(request.user):
                     logger.debug(
-                        f"Tenant admin {request.user.username} authenticated on {tenant.name} - allowed"
+                        "Tenant admin %s authenticated on %s - allowed",
+                        request.user.username, tenant.name,
                     )
                     return None
 
                 # Tenant managers can only be authenticated on their assigned tenant
                 if roles.is_tenant_manager(request.user, tenant):
                     logger.debug(
-                        f"Tenant manager {request.user.username} authenticated on their tenant {tenant.name} - allowed"
+                        "Tenant manager %s authenticated on their tenant %s - allowed",
+                        request.user.username, tenant.name,
                     )
                     return None
 
                 # If they have ANY tenancy role(s) but not for this tenant, treat them as not-a-member here
                 if self._has_any_tenancy_role(request.user):
                     logger.warning(
-                        f"Authenticated user {request.user.username} has tenancy roles but not for tenant "
-                        f"{tenant.name}. Logging out and returning 404."
+                        "Authenticated user %s has tenancy roles but not for tenant %s. "
+                        "Logging out and returning 404.",
+                        request.user.username, tenant.name,
                     )
                     logout(request)
                     raise Http404("Page not found")
@@ -135,44 +142,49 @@ class TenantMiddleware(MiddlewareMixin):
                 # This allows projects to have non-tenant users or public auth flows.
                 # Specific privileged areas (admin/manage) still guard themselves.
                 logger.debug(
-                    f"Authenticated user {request.user.username} has no tenancy roles; skipping membership enforcement."
+                    "Authenticated user %s has no tenancy roles; skipping membership enforcement.",
+                    request.user.username,
                 )
 
             # ------------------------------------------------------------------
             # PATH-SPECIFIC ENFORCEMENT FOR /manage/ (your existing logic, preserved)
             # ------------------------------------------------------------------
             if request.path.startswith("/manage/") and request.user.is_authenticated:
-                user_info = f"{request.user.username} (tenant: {getattr(request.user, 'tenant', 'N/A')})"
-                logger.info(
-                    f"Tenant admin access attempt - User: {user_info}, Request Tenant: {tenant.name}"
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Tenant admin access attempt - User: %s (tenant: %s), Request Tenant: %s",
+                        request.user.username, getattr(request.user, 'tenant', 'N/A'), tenant.name,
+                    )
 
                 # Tenant admins can access any tenant's /manage/
                 if roles.is_tenant_admin(request.user):
                     logger.info(
-                        f"Tenant admin {request.user.username} accessing {tenant.name} /manage/ - allowed"
+                        "Tenant admin %s accessing %s /manage/ - allowed",
+                        request.user.username, tenant.name,
                     )
                     return None
 
                 # Tenant managers can only access their assigned tenant's /manage/
                 if roles.is_tenant_manager(request.user, tenant):
                     logger.info(
-                        f"Tenant manager {request.user.username} accessing their tenant {tenant.name} /manage/ - allowed"
+                        "Tenant manager %s accessing their tenant %s /manage/ - allowed",
+                        request.user.username, tenant.name,
                     )
                     return None
 
                 # If user has tenant manager role but for a DIFFERENT tenant, return 404
                 if self._has_any_tenant_manager_role(request.user):
                     logger.warning(
-                        f"Tenant manager {request.user.username} attempted to access {tenant.name} /manage/ "
-                        f"but they don't have permission for this tenant - returning 404"
+                        "Tenant manager %s attempted to access %s /manage/ "
+                        "but they don't have permission for this tenant - returning 404",
+                        request.user.username, tenant.name,
                     )
                     raise Http404("Page not found")
 
                 # User is authenticated but has no tenant roles at all
                 logger.warning(
-                    f"User {request.user.username} attempted to access {tenant.name} /manage/ "
-                    f"but has no tenant roles - blocking access"
+                    "User %s attempted to access %s /manage/ but has no tenant roles - blocking access",
+                    request.user.username, tenant.name,
                 )
                 # Let the manage site's permission handling deal with it (login/403/etc).
                 return None
@@ -181,14 +193,14 @@ class TenantMiddleware(MiddlewareMixin):
 
         except Tenant.DoesNotExist:
             logger.error(
-                f"No active tenant found for domain: {hostname}. "
-                f"Available tenants: {list(Tenant.objects.filter(is_active=True).values_list('domain', flat=True))}"
+                "No active tenant found for domain: %s. Available tenants: %s",
+                hostname, list(Tenant.objects.filter(is_active=True).values_list('domain', flat=True)),
             )
 
             # Optional: Check if tenant exists but is inactive
             inactive_tenant = Tenant.objects.filter(domain=hostname, is_active=False).first()
             if inactive_tenant:
-                logger.warning(f"Tenant found for {hostname} but is inactive")
+                logger.warning("Tenant found for %s but is inactive", hostname)
                 return HttpResponseNotFound(
                     f"<h1>Tenant Inactive</h1>"
                     f"<p>The tenant for domain <strong>{hostname}</strong> is currently inactive.</p>"
@@ -228,7 +240,7 @@ class TenantMiddleware(MiddlewareMixin):
             )
 
         except Tenant.MultipleObjectsReturned:
-            logger.critical(f"Multiple active tenants found for domain: {hostname}")
+            logger.critical("Multiple active tenants found for domain: %s", hostname)
             return HttpResponse(
                 "<h1>Configuration Error</h1>"
                 "<p>Multiple tenants configured for this domain. Please contact support.</p>",
@@ -236,7 +248,7 @@ class TenantMiddleware(MiddlewareMixin):
             )
 
         except Exception as e:
-            logger.exception(f"Unexpected error in TenantMiddleware for hostname {hostname}: {e}")
+            logger.exception("Unexpected error in TenantMiddleware for hostname %s: %s", hostname, e)
             if settings.DEBUG:
                 raise
             return HttpResponse(
@@ -286,7 +298,7 @@ class TenantMiddleware(MiddlewareMixin):
         Check if user has tenant manager role for ANY tenant (not necessarily this one).
         Used to determine if we should show 404 vs 403.
         """
-        return TenancyRole.objects.filter(user=user, role=TenancyRole.TENANT_MANAGER).exists()
+        return roles.is_tenant_manager(user)
 
     def _has_any_tenancy_role(self, user) -> bool:
         """
@@ -294,7 +306,7 @@ class TenantMiddleware(MiddlewareMixin):
         This is used to decide whether an authenticated user should be treated as "not a member"
         when they're on the wrong tenant domain.
         """
-        return TenancyRole.objects.filter(user=user).exists()
+        return roles.has_any_tenancy_role(user)
 
     def process_response(self, request, response):
         clear_current_tenant()
@@ -302,7 +314,7 @@ class TenantMiddleware(MiddlewareMixin):
 
     def process_exception(self, request, exception):
         clear_current_tenant()
-        logger.exception(f"Exception in request processing: {exception}")
+        logger.exception("Exception in request processing: %s", exception)
         return None
 
 
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TenancyRole',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('tenantadmin', 'Tenant Admin - Can create and manage tenants'), ('tenantmanager', 'Tenant Manager - Can manage tenant-specific content')], help_text='Tenancy-specific role', max_length=50)),
+                ('assigned_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Tenancy Role',
+                'verbose_name_plural': 'Tenancy Roles',
+            },
+        ),
+        migrations.CreateModel(
+            name='Tenant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='The name of the tenant organization', max_length=255, verbose_name='Tenant Name')),
+                ('domain', models.CharField(db_index=True, help_text='Primary domain for this tenant (e.g., acme.example.com)', max_length=255, unique=True, verbose_name='Domain')),
+                ('is_active', models.BooleanField(default=True, help_text='Whether this tenant is currently active', verbose_name='Active')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+            ],
+            options={
+                'verbose_name': 'Tenant',
+                'verbose_name_plural': 'Tenants',
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('tenancy', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tenancyrole',
+            name='assigned_by',
+            field=models.ForeignKey(blank=True, help_text='User who assigned this role', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tenancy_roles_assigned', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='tenancyrole',
+            name='user',
+            field=models.ForeignKey(help_text='User who has this tenancy role', on_delete=django.db.models.deletion.CASCADE, related_name='tenancy_roles', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['domain'], name='tenancy_ten_domain_4fa5b9_idx'),
+        ),
+        migrations.AddField(
+            model_name='tenancyrole',
+            name='tenant',
+            field=models.ForeignKey(blank=True, help_text='Specific tenant this role applies to (only for tenantmanager role)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='role_assignments', to='tenancy.tenant'),
+        ),
+        migrations.AddIndex(
+            model_name='tenancyrole',
+            index=models.Index(fields=['user', 'role'], name='tenancy_ten_user_id_4060ec_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenancyrole',
+            index=models.Index(fields=['tenant'], name='tenancy_ten_tenant__587438_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='tenancyrole',
+            unique_together={('user', 'role', 'tenant')},
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenancy', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tenancyrole',
+            index=models.Index(condition=models.Q(('role', 'tenantadmin')), fields=['user'], name='tenancy_role_admin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenancyrole',
+            index=models.Index(condition=models.Q(('role', 'tenantmanager')), fields=['user', 'tenant'], name='tenancy_role_manager_idx'),
+        ),
+    ]
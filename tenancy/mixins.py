@@ -1,16 +1,57 @@
+from django.apps import apps
+from django.core.exceptions import EmptyResultSet
 from django.db import models
-from django.forms.models import model_to_dict
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.conf import settings
+from django.contrib.admin.options import InlineModelAdmin
+from django.forms.models import ModelChoiceIterator
 from django.utils.translation import gettext_lazy as _
 
+from .context import get_current_tenant
 from .managers import TenantManager
-from .models import Tenant
 from .roles import roles
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+_tenant_model = None
+_bootstrap_tenant_pk = None
+
+
+def _get_tenant_model():
+    """
+    Resolve the Tenant model lazily and cache it for subsequent calls.
+    """
+    global _tenant_model
+    if _tenant_model is None:
+        _tenant_model = apps.get_model('tenancy', 'Tenant')
+    return _tenant_model
+
+
+def _get_bootstrap_tenant_pk():
+    """
+    Return the primary key of the first tenant (lowest id), or None if there
+    are no tenants yet.
+
+    The value is cached once a tenant exists and reset whenever a tenant is
+    saved or deleted, so bootstrap saves and template lookups don't query the
+    tenant table every time.
+    """
+    global _bootstrap_tenant_pk
+    if _bootstrap_tenant_pk is None:
+        _bootstrap_tenant_pk = (
+            _get_tenant_model().objects.order_by('id').values_list('id', flat=True).first()
+        )
+    return _bootstrap_tenant_pk
+
+
+@receiver([post_save, post_delete], sender='tenancy.Tenant')
+def _reset_bootstrap_tenant_pk(sender, **kwargs):
+    global _bootstrap_tenant_pk
+    _bootstrap_tenant_pk = None
+
 
 class TenantUserMixin(models.Model):
     """
@@ -26,7 +67,7 @@ class TenantUserMixin(models.Model):
     contexts, set TENANCY_REQUIRE_TENANT_ON_USER_SAVE=True.
     """
     tenant = models.ForeignKey(
-        Tenant,
+        'tenancy.Tenant',
         null=True,
         blank=True,
         on_delete=models.PROTECT,
@@ -38,7 +79,6 @@ class TenantUserMixin(models.Model):
 
     def save(self, *args, **kwargs):
         if not getattr(self, 'tenant_id', None):
-            from .context import get_current_tenant
             current_tenant = get_current_tenant()
 
             if current_tenant is not None:
@@ -48,12 +88,12 @@ class TenantUserMixin(models.Model):
                 if getattr(settings, "TENANCY_REQUIRE_TENANT_ON_USER_SAVE", False):
                     if getattr(settings, "TENANCY_BOOTSTRAP", False):
                         # In bootstrap mode, fall back to the first tenant if it exists.
-                        bootstrap_tenant = Tenant.objects.first()
-                        if bootstrap_tenant is None:
+                        bootstrap_tenant_pk = _get_bootstrap_tenant_pk()
+                        if bootstrap_tenant_pk is None:
                             raise ValueError(
                                 f"No tenants exist in the database to bootstrap {self.__class__.__name__}."
                             )
-                        self.tenant = bootstrap_tenant
+                        self.tenant_id = bootstrap_tenant_pk
                     else:
                         raise ValueError(
                             f"Cannot save {self.__class__.__name__} without an active tenant. "
@@ -69,7 +109,7 @@ class TenantMixin(models.Model):
     Mixin to add tenant support and cloning capabilities to any Django model.
     """
     tenant = models.ForeignKey(
-        Tenant,
+        'tenancy.Tenant',
         on_delete=models.CASCADE,
         related_name='%(app_label)s_%(class)s_set',
         verbose_name='Tenant',
@@ -82,37 +122,43 @@ class TenantMixin(models.Model):
 
     CLONE_EXCLUDE_FIELDS = ("id", "pk")
 
+    # Class-level marker so hot paths can test for tenant models with a single
+    # attribute lookup instead of hasattr() + calling _is_tenant_model().
+    _is_tenant_model_flag = True
+
     class Meta:
         abstract = True
-        indexes = [
-            models.Index(fields=['tenant']),
-        ]
 
     def save(self, *args, **kwargs):
         """
         Override save to automatically set tenant from context if not set.
         """
-        if not self.tenant_id:
-            from .context import get_current_tenant
-            current_tenant = get_current_tenant()
+        if self.tenant_id is None:
+            self._resolve_tenant()
 
-            if current_tenant is None:
-                if getattr(settings, "TENANCY_BOOTSTRAP", False):
-                    from .models import Tenant
-                    current_tenant = Tenant.objects.first()
-                    if current_tenant is None:
-                        raise ValueError(
-                            f"No tenants exist in the database to bootstrap {self.__class__.__name__}."
-                        )
-                else:
-                    raise ValueError(
-                        f"Cannot save {self.__class__.__name__} without an active tenant. "
-                        "Either set the tenant explicitly or ensure middleware is active."
-                    )
+        super().save(*args, **kwargs)
 
-            self.tenant = current_tenant
+    def _resolve_tenant(self):
+        """
+        Set the tenant from the current context, or the bootstrap tenant when
+        TENANCY_BOOTSTRAP is enabled. Only called when no tenant is set.
+        """
+        current_tenant = get_current_tenant()
 
-        super().save(*args, **kwargs)
+        if current_tenant is not None:
+            self.tenant = current_tenant
+        elif getattr(settings, "TENANCY_BOOTSTRAP", False):
+            bootstrap_tenant_pk = _get_bootstrap_tenant_pk()
+            if bootstrap_tenant_pk is None:
+                raise ValueError(
+                    f"No tenants exist in the database to bootstrap {self.__class__.__name__}."
+                )
+            self.tenant_id = bootstrap_tenant_pk
+        else:
+            raise ValueError(
+                f"Cannot save {self.__class__.__name__} without an active tenant. "
+                "Either set the tenant explicitly or ensure middleware is active."
+            )
 
     @classmethod
     def _is_tenant_model(cls):
@@ -123,14 +169,14 @@ class TenantMixin(models.Model):
 
     @classmethod
     def get_template_queryset(cls):
-        template_tenant = Tenant.objects.order_by("id").first()
-        if template_tenant is None:
+        template_tenant_pk = _get_bootstrap_tenant_pk()
+        if template_tenant_pk is None:
             # use base manager so we don't depend on tenant context
             return cls._base_manager.none()
 
         # IMPORTANT: bypass automatic tenant filtering
         base_qs = cls._base_manager.all()
-        return base_qs.filter(tenant=template_tenant)
+        return base_qs.filter(tenant_id=template_tenant_pk)
 
 
 class TenantAdminMixin:
@@ -144,25 +190,29 @@ class TenantAdminMixin:
     and DENY access to tenantadmin role (they should use super_admin_site instead).
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Resolved once per admin instance instead of probing on every request.
+        self._model_is_tenant_aware = hasattr(self.model, 'tenant')
+
     def get_queryset(self, request):
         """
         Filter queryset to current tenant's objects.
         This is the core of tenant isolation - tenant managers can only
         see objects belonging to their tenant, never objects from other tenants.
         """
+        tenant = getattr(request, 'tenant', None)
         qs = super().get_queryset(request)
-        if hasattr(request, 'tenant') and request.tenant:
-            if hasattr(qs.model, 'tenant'):
-                return qs.filter(tenant=request.tenant)
-        return qs
+        if tenant is None or not self._model_is_tenant_aware:
+            return qs
+        return qs.filter(tenant_id=tenant.pk)
 
     def save_model(self, request, obj, form, change):
         """
         Automatically set tenant on new objects.
         """
-        if hasattr(obj, 'tenant') and not change:
-            if not getattr(obj, 'tenant_id', None):
-                obj.tenant = request.tenant
+        if self._model_is_tenant_aware and not change and not obj.tenant_id:
+            obj.tenant = request.tenant
         super().save_model(request, obj, form, change)
 
     def has_module_permission(self, request):
@@ -171,19 +221,30 @@ class TenantAdminMixin:
 
         CRITICAL CHANGE: Tenant admins have access to ALL tenants.
         Tenant managers only have access to their assigned tenant.
+
+        The result is memoized on the request, since Django admin asks for it
+        from every other permission hook, once per model and changelist row.
         """
-        if not request.user.is_active:
+        allowed = getattr(request, '_tenancy_module_perm', None)
+        if allowed is None:
+            allowed = request._tenancy_module_perm = self._check_module_permission(request)
+        return allowed
+
+    def _check_module_permission(self, request):
+        user = request.user
+        if not user.is_authenticated or not user.is_active:
             return False
 
         # Tenant admins have access to everything
-        if roles.is_tenant_admin(request.user):
+        if roles.is_tenant_admin(user):
             return True
 
-        if not hasattr(request, 'tenant') or request.tenant is None:
+        tenant = getattr(request, 'tenant', None)
+        if tenant is None:
             return False
 
         # Tenant managers can only access their assigned tenant
-        return roles.is_tenant_manager(request.user, request.tenant)
+        return roles.is_tenant_manager(user, tenant)
 
     def has_add_permission(self, request, obj=None):
         if not self.has_module_permission(request):
@@ -191,7 +252,6 @@ class TenantAdminMixin:
         # Tenant managers may not add objects; only tenant admins can
         if roles.is_tenant_admin(request.user):
             # Check if this is an InlineModelAdmin (which requires obj parameter)
-            from django.contrib.admin.options import InlineModelAdmin
             if isinstance(self, InlineModelAdmin):
                 return super().has_add_permission(request, obj)
             else:
@@ -231,7 +291,7 @@ class TenantAdminMixin:
         Exclude tenant field from forms - it's set automatically.
         """
         exclude = list(super().get_exclude(request, obj) or [])
-        if hasattr(self.model, 'tenant') and 'tenant' not in exclude:
+        if self._model_is_tenant_aware and 'tenant' not in exclude:
             exclude.append('tenant')
         return exclude
 
@@ -241,12 +301,63 @@ class TenantAdminMixin:
         """
         model = db_field.remote_field.model
 
-        if hasattr(model, "_is_tenant_model") and model._is_tenant_model():
+        tenant = None
+        if getattr(model, "_is_tenant_model_flag", False):
             tenant = getattr(request, 'tenant', None)
             if tenant:
                 kwargs["queryset"] = model.objects.filter(tenant=tenant)
 
-        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+        formfield = super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+        if tenant and formfield is not None and type(formfield).iterator is ModelChoiceIterator:
+            # Inline formsets render the same FK select once per form; let those
+            # fields share one evaluated result list for the request.
+            fk_cache = getattr(request, '_tenancy_fk_cache', None)
+            if fk_cache is None:
+                fk_cache = request._tenancy_fk_cache = {}
+            formfield.iterator = _SharedModelChoiceIterator
+            formfield._tenancy_fk_cache = fk_cache
+
+        return formfield
+
+
+class _SharedModelChoiceIterator(ModelChoiceIterator):
+    """
+    ModelChoiceIterator that reuses rows already fetched for an identical query.
+
+    Results are shared through a per-request dict keyed by the compiled SQL and
+    params, so a field whose queryset was narrowed (by a subclass,
+    limit_choices_to, ...) simply runs its own query, and choices keep their
+    ModelChoiceIteratorValue values.
+    """
+
+    def _shared_objects(self):
+        queryset = self.queryset
+        if queryset._prefetch_related_lookups:
+            return None
+        try:
+            sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+            key = (queryset.db, sql, tuple(params))
+            hash(key)
+        except (EmptyResultSet, TypeError):
+            return None
+
+        fk_cache = self.field._tenancy_fk_cache
+        objects = fk_cache.get(key)
+        if objects is None:
+            objects = fk_cache[key] = list(queryset)
+        return objects
+
+    def __iter__(self):
+        objects = self._shared_objects()
+        if objects is None:
+            yield from super().__iter__()
+            return
+
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in objects:
+            yield self.choice(obj)
 
 
 class SuperUserAdminMixin:
@@ -264,18 +375,32 @@ class SuperUserAdminMixin:
 
     readonly_fields = ('tenant',)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._model_is_tenant_aware = hasattr(self.model, 'tenant')
+        self._cached_list_display = None
+
     def has_module_permission(self, request, obj=None):
         """
         Check if user has permission to access this module in super admin.
 
         NEW: Only tenant admins can access super admin modules.
         This is the critical permission check that was missing!
+
+        The result is memoized on the request (see TenantAdminMixin).
         """
-        if not request.user.is_active:
+        allowed = getattr(request, '_tenancy_super_module_perm', None)
+        if allowed is None:
+            allowed = request._tenancy_super_module_perm = self._check_module_permission(request)
+        return allowed
+
+    def _check_module_permission(self, request):
+        user = request.user
+        if not user.is_authenticated or not user.is_active:
             return False
 
         # ONLY tenant admins can access super admin site
-        return roles.is_tenant_admin(request.user)
+        return roles.is_tenant_admin(user)
 
     def has_add_permission(self, request, obj=None):
         """
@@ -287,7 +412,6 @@ class SuperUserAdminMixin:
             return False
 
         # Check if this is an InlineModelAdmin (which requires obj parameter)
-        from django.contrib.admin.options import InlineModelAdmin
         if isinstance(self, InlineModelAdmin):
             return super().has_add_permission(request, obj)
         else:
@@ -320,12 +444,24 @@ class SuperUserAdminMixin:
         """
         return self.has_module_permission(request)
 
+    def get_queryset(self, request):
+        """
+        Join the tenant in the changelist query so tenant_display doesn't
+        fetch it once per row.
+        """
+        qs = super().get_queryset(request)
+        if self._model_is_tenant_aware:
+            qs = qs.select_related('tenant')
+        return qs
+
     def tenant_display(self, obj):
         """
         Display tenant information in list view with ID and domain.
         """
-        if hasattr(obj, 'tenant') and obj.tenant:
-            return f"{obj.tenant.id} – {obj.tenant.domain}"
+        if self._model_is_tenant_aware and obj.tenant_id:
+            # tenant_id is the local column; only the domain needs the
+            # tenant, which get_queryset() already joined.
+            return f"{obj.tenant_id} – {obj.tenant.domain}"
         return "-"
 
     tenant_display.short_description = "Tenant"
@@ -333,8 +469,17 @@ class SuperUserAdminMixin:
     def get_list_display(self, request, obj=None):
         """
         Add tenant_display to list view.
+
+        The result is memoized per base list_display (as a tuple, since it is
+        shared between calls), so the usual static value is only extended once
+        rather than on every changelist.
         """
-        base = list(super().get_list_display(request))
-        if 'tenant_display' not in base:
-            base.append('tenant_display')
-        return base
\ No newline at end of file
+        base = tuple(super().get_list_display(request))
+        cached = self._cached_list_display
+        if cached is None or cached[0] != base:
+            if 'tenant_display' in base:
+                cached = (base, base)
+            else:
+                cached = (base, (*base, 'tenant_display'))
+            self._cached_list_display = cached
+        return cached[1]
\ No newline at end of file
@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from .context import clear_current_tenant, set_current_tenant
+
 
 class Tenant(models.Model):
     """
@@ -50,14 +52,12 @@ class Tenant(models.Model):
         """
         Activate this tenant in the current thread context.
         """
-        from .context import set_current_tenant
         set_current_tenant(self)
 
     def deactivate(self):
         """
         Deactivate the current tenant context.
         """
-        from .context import clear_current_tenant
         clear_current_tenant()
 
 
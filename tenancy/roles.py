@@ -9,8 +9,14 @@ Roles:
 - tenantmanager: Can access tenant admin site to manage tenant-specific content
 """
 
-from django.db import models
+from functools import wraps
+
+from django.apps import apps
+from django.db import connections, models, router
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 
 
@@ -68,6 +74,19 @@ class TenancyRole(models.Model):
         indexes = [
             models.Index(fields=['user', 'role']),
             models.Index(fields=['tenant']),
+            # Partial indexes for the per-request role checks. Backends without
+            # partial index support (MySQL) skip these with check models.W037
+            # and keep using (user, role).
+            models.Index(
+                fields=['user'],
+                name='tenancy_role_admin_idx',
+                condition=models.Q(role='tenantadmin'),
+            ),
+            models.Index(
+                fields=['user', 'tenant'],
+                name='tenancy_role_manager_idx',
+                condition=models.Q(role='tenantmanager'),
+            ),
         ]
         verbose_name = 'Tenancy Role'
         verbose_name_plural = 'Tenancy Roles'
@@ -94,11 +113,139 @@ class TenancyRole(models.Model):
                 'tenant': 'Tenant manager role must be assigned to a specific tenant.'
             })
 
+    def validate_rules(self):
+        """
+        Run the pure-Python checks (choices, role rules) without queries.
+
+        full_clean() would also SELECT each FK target and the unique_together
+        row, which the database already enforces.
+        """
+        self.clean_fields(exclude=['user', 'tenant', 'assigned_by'])
+        self.clean()
+
     def save(self, *args, **kwargs):
-        self.full_clean()
+        self.validate_rules()
         super().save(*args, **kwargs)
 
 
+_tenant_model = None
+
+
+def _get_tenant_model():
+    """
+    Resolve the Tenant model lazily (tenancy.models imports this module) and
+    cache it for subsequent calls.
+    """
+    global _tenant_model
+    if _tenant_model is None:
+        _tenant_model = apps.get_model('tenancy', 'Tenant')
+    return _tenant_model
+
+
+def _auth_required(default):
+    """
+    Return ``default`` without calling the check for missing or anonymous users.
+    """
+    def decorator(check):
+        @wraps(check)
+        def wrapper(user, *args, **kwargs):
+            if not user or not user.is_authenticated:
+                return default
+            return check(user, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _admin_cache_key(user_pk):
+    return f"tenancy:admin:{user_pk}"
+
+
+def _invalidate_admin_cache(user_pks):
+    """
+    Drop the shared tenant-admin cache entries for the given users.
+    """
+    if getattr(settings, 'TENANCY_ROLE_CACHE_TIMEOUT', 0):
+        cache.delete_many([_admin_cache_key(pk) for pk in user_pks])
+
+
+@receiver([post_save, post_delete], sender=TenancyRole)
+def _invalidate_admin_cache_on_change(sender, instance, **kwargs):
+    """
+    Invalidate when a role row is saved or deleted through the ORM, e.g. from
+    the admin. Bulk paths in TenancyRoleManager invalidate explicitly.
+    """
+    _invalidate_admin_cache([instance.user_id])
+
+
+def _has_external_delete_receivers():
+    """
+    True when anything other than _invalidate_admin_cache_on_change listens for
+    TenancyRole deletions.
+    """
+    if pre_delete.has_listeners(TenancyRole):
+        return True
+    live = post_delete._live_receivers(TenancyRole)
+    if isinstance(live, tuple):
+        # Django 5.0+ returns (sync_receivers, async_receivers)
+        live = [*live[0], *live[1]]
+    return any(r is not _invalidate_admin_cache_on_change for r in live)
+
+
+def _query_tenant_admin(user):
+    """
+    Look up the tenant admin role, optionally through Django's cache.
+
+    With TENANCY_ROLE_CACHE_TIMEOUT set, the answer is shared across requests
+    and processes for that many seconds. Changes made through the ORM
+    invalidate it; with a per-process cache backend (LocMemCache) other
+    processes may see a stale answer until the timeout expires.
+    """
+    timeout = getattr(settings, 'TENANCY_ROLE_CACHE_TIMEOUT', 0)
+    if not timeout:
+        return TenancyRole.objects.filter(
+            user=user,
+            role=TenancyRole.TENANT_ADMIN
+        ).exists()
+
+    key = _admin_cache_key(user.pk)
+    result = cache.get(key)
+    if result is None:
+        result = TenancyRole.objects.filter(
+            user=user,
+            role=TenancyRole.TENANT_ADMIN
+        ).exists()
+        cache.set(key, result, timeout)
+    return result
+
+
+def _cached_role_check(user, key, check):
+    """
+    Run a role query at most once per user object.
+
+    The result is memoized on the user instance. ``request.user`` is loaded
+    fresh for every request, so middleware, admin and views share the cached
+    answer for the lifetime of the request, while the next request sees any
+    role changes. assign_role() and revoke_role() clear the cache.
+    """
+    role_cache = getattr(user, '_tenancy_role_cache', None)
+    if role_cache is None:
+        role_cache = user._tenancy_role_cache = {}
+
+    try:
+        return role_cache[key]
+    except KeyError:
+        result = role_cache[key] = check()
+        return result
+
+
+def _clear_role_cache(user):
+    """Drop memoized role checks from a user object."""
+    try:
+        del user._tenancy_role_cache
+    except AttributeError:
+        pass
+
+
 class TenancyRoleManager:
     """
     Helper class for checking and managing tenancy roles.
@@ -114,6 +261,7 @@ class TenancyRoleManager:
     """
 
     @staticmethod
+    @_auth_required(False)
     def is_tenant_admin(user):
         """
         Check if user has tenant admin role.
@@ -124,15 +272,10 @@ class TenancyRoleManager:
         - Manage all tenants
         - View cross-tenant data
         """
-        if not user or not user.is_authenticated:
-            return False
-
-        return TenancyRole.objects.filter(
-            user=user,
-            role=TenancyRole.TENANT_ADMIN
-        ).exists()
+        return _cached_role_check(user, 'admin', lambda: _query_tenant_admin(user))
 
     @staticmethod
+    @_auth_required(False)
     def is_tenant_manager(user, tenant=None):
         """
         Check if user has tenant manager role.
@@ -146,76 +289,183 @@ class TenancyRoleManager:
             user: Django user object
             tenant: Optional Tenant object to check specific tenant access
         """
-        if not user or not user.is_authenticated:
-            return False
+        def check():
+            query = TenancyRole.objects.filter(
+                user=user,
+                role=TenancyRole.TENANT_MANAGER
+            )
 
-        query = TenancyRole.objects.filter(
-            user=user,
-            role=TenancyRole.TENANT_MANAGER
-        )
+            # If checking for specific tenant, filter by it
+            if tenant:
+                query = query.filter(tenant=tenant)
 
-        # If checking for specific tenant, filter by it
-        if tenant:
-            query = query.filter(tenant=tenant)
+            return query.exists()
 
-        return query.exists()
+        return _cached_role_check(
+            user, ('manager', tenant.pk if tenant else None), check
+        )
 
     @staticmethod
     def get_managed_tenants(user):
         """
         Get all tenants that a user can manage.
         """
+        Tenant = _get_tenant_model()
+
         if not user or not user.is_authenticated:
-            from tenancy.models import Tenant
             return Tenant.objects.none()
 
         # If user is tenant admin, return all tenants
         if TenancyRoleManager.is_tenant_admin(user):
-            from tenancy.models import Tenant
             return Tenant.objects.all()
 
-        # Otherwise return only tenants they're assigned to manage
-        tenant_ids = TenancyRole.objects.filter(
-            user=user,
-            role=TenancyRole.TENANT_MANAGER
-        ).values_list('tenant_id', flat=True)
+        # Otherwise return only tenants they're assigned to manage. One JOIN;
+        # unique_together on (user, role, tenant) means no duplicate rows.
+        return Tenant.objects.filter(
+            role_assignments__user=user,
+            role_assignments__role=TenancyRole.TENANT_MANAGER,
+        )
 
-        from tenancy.models import Tenant
-        return Tenant.objects.filter(id__in=tenant_ids)
+    @staticmethod
+    def get_managed_tenants_with_roles(user):
+        """
+        Like get_managed_tenants(), with each tenant's role assignments prefetched.
+
+        Use this when iterating tenants and reading ``tenant.role_assignments``;
+        callers that only count or test membership should use the plain version.
+        """
+        return TenancyRoleManager.get_managed_tenants(user).prefetch_related(
+            models.Prefetch(
+                'role_assignments',
+                queryset=TenancyRole.objects.only('id', 'user_id', 'role', 'tenant_id'),
+            )
+        )
 
     @staticmethod
     def assign_role(user, role, tenant=None, assigned_by=None):
         """
         Assign a tenancy role to a user.
         """
-        role_obj, created = TenancyRole.objects.get_or_create(
-            user=user,
-            role=role,
-            tenant=tenant,
-            defaults={'assigned_by': assigned_by}
-        )
+        vendor = connections[router.db_for_write(TenancyRole)].vendor
+        if tenant is not None and vendor == 'postgresql':
+            # Insert-or-ignore, then read back: no SELECT-then-INSERT race and
+            # no savepoint around the insert. Only on PostgreSQL, where
+            # ON CONFLICT DO NOTHING skips just the unique conflict; MySQL's
+            # INSERT IGNORE would also swallow FK and data errors. NULL tenants
+            # are never equal in unique_together, so they can't use it at all.
+            role_obj = TenancyRole(
+                user=user, role=role, tenant=tenant, assigned_by=assigned_by
+            )
+            role_obj.validate_rules()
+            TenancyRole.objects.bulk_create([role_obj], ignore_conflicts=True)
+            role_obj = TenancyRole.objects.get(user=user, role=role, tenant=tenant)
+            # bulk_create sends no post_save, so invalidate here
+            _invalidate_admin_cache([user.pk])
+        else:
+            role_obj, created = TenancyRole.objects.get_or_create(
+                user=user,
+                role=role,
+                tenant=tenant,
+                defaults={'assigned_by': assigned_by}
+            )
+        _clear_role_cache(user)
         return role_obj
 
+    @staticmethod
+    def assign_roles_bulk(assignments, assigned_by=None):
+        """
+        Assign many tenancy roles at once.
+
+        Args:
+            assignments: Iterable of ``(user, role, tenant)`` tuples; ``tenant``
+                is None for tenant admins
+            assigned_by: Optional user recorded on every new assignment
+
+        Roles the users already have are skipped. Returns the list of role
+        objects passed to bulk_create (primary keys are not set on every backend).
+        """
+        role_objs = []
+        users = []
+        seen = set()
+        for user, role, tenant in assignments:
+            users.append(user)
+            key = (user.pk, role, tenant.pk if tenant else None)
+            if key in seen:
+                continue
+            seen.add(key)
+            role_obj = TenancyRole(
+                user=user, role=role, tenant=tenant, assigned_by=assigned_by
+            )
+            role_obj.validate_rules()
+            role_objs.append(role_obj)
+
+        # ignore_conflicts can't catch duplicates with a NULL tenant, so drop
+        # system-wide roles that already exist with one query.
+        untenanted_user_pks = {obj.user_id for obj in role_objs if obj.tenant_id is None}
+        if untenanted_user_pks:
+            existing = set(
+                TenancyRole.objects.filter(
+                    user_id__in=untenanted_user_pks, tenant__isnull=True
+                ).values_list('user_id', 'role')
+            )
+            role_objs = [
+                obj for obj in role_objs
+                if obj.tenant_id is not None or (obj.user_id, obj.role) not in existing
+            ]
+
+        created = TenancyRole.objects.bulk_create(
+            role_objs, batch_size=500, ignore_conflicts=True
+        )
+
+        # bulk_create sends no post_save, so invalidate caches here
+        _invalidate_admin_cache(untenanted_user_pks)
+        for user in users:
+            _clear_role_cache(user)
+
+        return created
+
     @staticmethod
     def revoke_role(user, role, tenant=None):
         """
         Revoke a tenancy role from a user.
+
+        pre_delete/post_delete receivers for TenancyRole (audit logs and the
+        like) still fire. Only when there are none besides this module's own
+        cache invalidation is the row removed with a single DELETE.
         """
-        return TenancyRole.objects.filter(
+        queryset = TenancyRole.objects.filter(
             user=user,
             role=role,
             tenant=tenant
-        ).delete()[0]
+        )
+        if _has_external_delete_receivers():
+            deleted = queryset.delete()[0]
+        else:
+            # Nothing references TenancyRole, so skip the deletion collector
+            # (which SELECTs the rows first to send the signals) and issue a
+            # single DELETE; the cache invalidation below replaces our receiver.
+            deleted = queryset._raw_delete(using=queryset.db)
+        _invalidate_admin_cache([user.pk])
+        _clear_role_cache(user)
+        return deleted
 
     @staticmethod
+    @_auth_required(False)
     def has_any_tenancy_role(user):
         """
         Check if user has any tenancy role.
         """
-        if not user or not user.is_authenticated:
-            return False
-
-        return TenancyRole.objects.filter(user=user).exists()
+        # Derive the answer from admin/manager checks already run on this user
+        role_cache = getattr(user, '_tenancy_role_cache', None)
+        if role_cache:
+            if any(role_cache.values()):
+                return True
+            if role_cache.get('admin') is False and role_cache.get(('manager', None)) is False:
+                return False
+
+        return _cached_role_check(
+            user, 'any', lambda: TenancyRole.objects.filter(user=user).exists()
+        )
 
 
 # Singleton instance for easy importing
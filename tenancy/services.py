@@ -1,13 +1,15 @@
 from django.contrib.auth import get_user_model
-from django.apps import apps
 from django.db import IntegrityError, transaction
+from django.db.models import Count, IntegerField, Value
 
+from .mixins import _get_bootstrap_tenant_pk
 from .models import Tenant
-from .utils import clone_all_template_objects
-from .roles import TenancyRole, roles
+from .utils import _get_clone_plan, clone_all_template_objects, get_all_tenant_models
+from .roles import roles
 from .signals import tenant_provisioned
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
 
 User = get_user_model()
@@ -43,7 +45,7 @@ def can_user_authenticate_on_tenant(*, user, tenant) -> TenantAuthzResult:
         return TenantAuthzResult(True, "ok_manager", user)
 
     # Has some tenancy role(s), but not for this tenant
-    if TenancyRole.objects.filter(user=user).exists():
+    if roles.has_any_tenancy_role(user):
         return TenantAuthzResult(False, "wrong_tenant", user)
 
     # No tenancy roles at all (project may or may not want to allow these)
@@ -72,6 +74,31 @@ class TenantProvisioner:
     Service class for provisioning new tenants with default data.
     """
 
+    @staticmethod
+    def _create_tenant_and_admin(tenant_data: dict, admin_data: dict):
+        """
+        Create the tenant row and its admin user. Shared by both create_tenant
+        variants; the caller provides the transaction.
+        """
+        tenant = Tenant.objects.create(
+            name=tenant_data['name'],
+            domain=tenant_data['domain'],
+            is_active=tenant_data.get('is_active', True)
+        )
+        logger.info("✓ Tenant created: %s (id=%s)", tenant.name, tenant.id)
+
+        user = User.objects.create_user(
+            username=admin_data['username'],
+            email=admin_data.get('email', ''),
+            password=admin_data['password'],
+            tenant=tenant,
+            is_staff=True,
+            is_superuser=True,
+        )
+        logger.info("✓ Admin user created: %s (id=%s)", user.username, user.id)
+
+        return tenant, user
+
     @staticmethod
     @transaction.atomic
     def create_tenant(tenant_data: dict, admin_data: dict):
@@ -79,45 +106,35 @@ class TenantProvisioner:
         Create a new tenant with admin user and clone all template objects.
         """
         try:
-            # Step 1: Create the tenant
-            logger.info(f"Creating new tenant: {tenant_data['name']}")
-            tenant = Tenant.objects.create(
-                name=tenant_data['name'],
-                domain=tenant_data['domain'],
-                is_active=tenant_data.get('is_active', True)
-            )
-            logger.info(f"✓ Tenant created: {tenant.name} (id={tenant.id})")
-
-            # Step 2: Create admin user for the tenant
-            logger.info(f"Creating admin user: {admin_data['username']}")
-            user = User.objects.create_user(
-                username=admin_data['username'],
-                email=admin_data.get('email', ''),
-                password=admin_data['password'],
-                tenant=tenant,
-            )
-            user.is_staff = True
-            user.is_superuser = True
-            user.save()
-            logger.info(f"✓ Admin user created: {user.username} (id={user.id})")
+            # Steps 1-2: Create the tenant and its admin user
+            logger.info("Creating new tenant: %s", tenant_data['name'])
+            tenant, user = TenantProvisioner._create_tenant_and_admin(tenant_data, admin_data)
 
             # Step 3: Clone all template objects for the new tenant
-            logger.info("=" * 60)
-            logger.info("Beginning template object cloning...")
-            logger.info("=" * 60)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("=" * 60)
+                logger.info("Beginning template object cloning...")
+                logger.info("=" * 60)
 
+            # Any clone failure aborts this whole transaction, so skip the savepoint
             clone_map = clone_all_template_objects(
                 new_tenant=tenant,
+                savepoint=False,
             )
 
             # Log cloning summary
             total_cloned = sum(len(objects) for objects in clone_map.values())
-            logger.info("=" * 60)
-            logger.info(f"✓ Cloning complete: {total_cloned} objects across {len(clone_map)} models")
-            logger.info("=" * 60)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("=" * 60)
+                logger.info(
+                    "✓ Cloning complete: %d objects across %d models",
+                    total_cloned, len(clone_map),
+                )
+                logger.info("=" * 60)
 
-            for model_class, cloned_objects in clone_map.items():
-                logger.info(f"  • {model_class.__name__}: {len(cloned_objects)} objects")
+            if logger.isEnabledFor(logging.DEBUG):
+                for model_class, cloned_objects in clone_map.items():
+                    logger.debug("  • %s: %d objects", model_class.__name__, len(cloned_objects))
 
             # Build a compact summary payload for receivers (avoid sending clone_map itself)
             clone_summary = {
@@ -146,7 +163,7 @@ class TenantProvisioner:
                 f"A tenant with domain '{tenant_data.get('domain')}' already exists."
             ) from e
         except Exception as e:
-            logger.error(f"Failed to create tenant: {e}", exc_info=True)
+            logger.error("Failed to create tenant: %s", e, exc_info=True)
             raise TenantProvisioningError(
                 f"Tenant provisioning failed: {str(e)}"
             ) from e
@@ -162,40 +179,25 @@ class TenantProvisioner:
 
         try:
             # Create tenant and admin user
-            logger.info(f"Creating tenant with custom overrides: {tenant_data['name']}")
-            tenant = Tenant.objects.create(
-                name=tenant_data['name'],
-                domain=tenant_data['domain'],
-                is_active=tenant_data.get('is_active', True)
-            )
-
-            user = User.objects.create_user(
-                username=admin_data['username'],
-                email=admin_data.get('email', ''),
-                password=admin_data['password'],
-                tenant=tenant,
-            )
-            user.is_staff = True
-            user.is_superuser = True
-            user.save()
-
-            logger.info(f"✓ Tenant and admin created")
+            logger.info("Creating tenant with custom overrides: %s", tenant_data['name'])
+            tenant, user = TenantProvisioner._create_tenant_and_admin(tenant_data, admin_data)
             logger.info("Beginning custom cloning with overrides...")
 
             # Clone with custom configuration
             clone_map = clone_all_template_objects(
                 new_tenant=tenant,
                 excluded_models=excluded_models or [],
-                field_overrides=field_overrides or {}
+                field_overrides=field_overrides or {},
+                savepoint=False,
             )
 
             total_cloned = sum(len(objects) for objects in clone_map.values())
-            logger.info(f"✓ Cloned {total_cloned} objects with custom overrides")
+            logger.info("✓ Cloned %d objects with custom overrides", total_cloned)
 
             return tenant, user, clone_map
 
         except Exception as e:
-            logger.error(f"Failed to create tenant with overrides: {e}", exc_info=True)
+            logger.error("Failed to create tenant with overrides: %s", e, exc_info=True)
             raise TenantProvisioningError(
                 f"Custom tenant provisioning failed: {str(e)}"
             ) from e
@@ -205,40 +207,69 @@ class TenantProvisioner:
         """
         Preview which models will be cloned and their cloning modes.
         """
-        from .utils import get_all_tenant_models, _get_clone_mode
-        from .models import Tenant
-
-        template_tenant = Tenant.objects.order_by("id").first()
-        if not template_tenant:
+        template_tenant_pk = _get_bootstrap_tenant_pk()
+        if template_tenant_pk is None:
             return []
 
         preview = []
         tenant_models = get_all_tenant_models()
+        template_querysets = []
 
         for model in tenant_models:
             # Get template queryset
             if hasattr(model, 'get_template_queryset'):
                 qs = model.get_template_queryset()
             else:
-                qs = model.objects.filter(tenant=template_tenant)
+                qs = model.objects.filter(tenant_id=template_tenant_pk)
+            template_querysets.append(qs)
 
-            # Get cloning mode
-            clone_mode = _get_clone_mode(model)
+        counts = _count_querysets(template_querysets)
 
-            # Check for metadata
-            has_overrides = hasattr(model, 'CLONE_FIELD_OVERRIDES')
-            overrides = getattr(model, 'CLONE_FIELD_OVERRIDES', {}) if has_overrides else {}
+        for index, model in enumerate(tenant_models):
+            # Cloning mode and metadata, from the same cached plan the cloner uses
+            plan = _get_clone_plan(model)
+            has_overrides = plan.field_overrides is not None
 
             preview.append({
                 'model': model.__name__,
-                'count': qs.count(),
-                'mode': clone_mode,
+                'count': counts.get(index, 0),
+                'mode': plan.mode,
                 'has_overrides': has_overrides,
-                'overrides': overrides,
+                'overrides': plan.field_overrides if has_overrides else {},
             })
 
         return preview
 
+
+def _count_querysets(querysets):
+    """
+    Count several querysets with one UNION ALL query per database.
+
+    Returns a dict mapping each queryset's position in ``querysets`` to its
+    row count. Sliced, distinct or combined querysets can't be re-annotated
+    inside the union, so they are counted on their own.
+    """
+    counts = {}
+    by_db = defaultdict(list)
+    for index, qs in enumerate(querysets):
+        if qs.query.is_sliced or qs.query.distinct or qs.query.combinator:
+            counts[index] = qs.count()
+            continue
+        by_db[qs.db].append(
+            qs.order_by()
+            .annotate(qs_index=Value(index, output_field=IntegerField()))
+            .values('qs_index')
+            .annotate(row_count=Count('pk'))
+        )
+
+    for count_querysets in by_db.values():
+        first, *rest = count_querysets
+        combined = first.union(*rest, all=True) if rest else first
+        for row in combined:
+            counts[row['qs_index']] = row['row_count']
+    return counts
+
+
 def log_cloning_preview():
     """
     Log a preview of what will be cloned to the console.
@@ -255,12 +286,12 @@ def log_cloning_preview():
 
     for info in preview:
         mode_str = f"→ {info['mode']} clone"
-        logger.info(f"{info['model']} ({info['count']} objects) {mode_str}")
+        logger.info("%s (%s objects) %s", info['model'], info['count'], mode_str)
 
         if info['has_overrides']:
             override_str = ", ".join(
                 f"{k}={v}" for k, v in info['overrides'].items()
             )
-            logger.info(f"  ↳ Overrides: {override_str}")
+            logger.info("  ↳ Overrides: %s", override_str)
 
     logger.info("\n" + "=" * 60 + "\n")
\ No newline at end of file
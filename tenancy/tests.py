@@ -1,3 +1,391 @@
-from django.test import TestCase
+import warnings
+from collections import OrderedDict
+from unittest import mock
 
-# Create your tests here.
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection, models, transaction
+from django.db.models.signals import post_delete
+from django.forms.models import modelformset_factory
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import isolate_apps
+
+from . import warnings as tenancy_warnings
+from .context import clear_current_tenant, set_current_tenant
+from .mixins import SuperUserAdminMixin, TenantAdminMixin, TenantMixin
+from .models import Tenant
+from .roles import TenancyRole, roles
+from .services import _count_querysets
+from .utils import (
+    CloneError, CyclicDependencyError, _topological_sort_models, clone_tenant_objects,
+)
+
+
+# -----------------------------------------------------------------------------
+# Test-only models. They live in the tenancy app but have no migration; the
+# test cases that need their tables create them in setUpClass.
+# -----------------------------------------------------------------------------
+
+class CloneFont(TenantMixin):
+    name = models.CharField(max_length=50)
+    token = models.CharField(max_length=20, default='fresh', editable=False)
+
+    class Meta:
+        app_label = 'tenancy'
+
+
+class CloneTheme(TenantMixin):
+    name = models.CharField(max_length=50)
+    font = models.ForeignKey(CloneFont, on_delete=models.CASCADE, null=True)
+    parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True)
+
+    class Meta:
+        app_label = 'tenancy'
+
+
+TEST_MODELS = (CloneFont, CloneTheme)
+
+
+class TestModelsMixin:
+    """
+    Create the test-only tables around the class-wide transaction.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as editor:
+            for model in TEST_MODELS:
+                editor.create_model(model)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as editor:
+            for model in reversed(TEST_MODELS):
+                editor.delete_model(model)
+
+
+class SuperUserAdminMixinTests(TestCase):
+
+    def test_model_admin_adds_tenant_display_once(self):
+        class FontAdmin(SuperUserAdminMixin, admin.ModelAdmin):
+            list_display = ('name',)
+
+        model_admin = FontAdmin(CloneFont, admin.site)
+        request = RequestFactory().get('/')
+
+        list_display = model_admin.get_list_display(request)
+        self.assertEqual(list_display, ('name', 'tenant_display'))
+        self.assertIs(model_admin.get_list_display(request), list_display)
+        # The class attribute is left alone
+        self.assertEqual(model_admin.list_display, ('name',))
+
+    def test_inline_admin_instantiates(self):
+        class ThemeInline(SuperUserAdminMixin, admin.TabularInline):
+            model = CloneTheme
+
+        inline = ThemeInline(CloneFont, admin.site)
+        self.assertTrue(inline._model_is_tenant_aware)
+
+
+class TenantAdminMixinForeignKeyTests(TestModelsMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Acme', domain='acme.test')
+        cls.other = Tenant.objects.create(name='Other', domain='other.test')
+        cls.font_a = CloneFont.objects.create(name='A', tenant=cls.tenant)
+        cls.font_b = CloneFont.objects.create(name='B', tenant=cls.tenant)
+        cls.font_c = CloneFont.objects.create(name='C', tenant=cls.other)
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        self.addCleanup(clear_current_tenant)
+        self.request = RequestFactory().get('/')
+        self.request.tenant = self.tenant
+
+    def _render_formset(self, model_admin, extra=5):
+        def formfield_callback(db_field, **kwargs):
+            if db_field.name == 'font':
+                return model_admin.formfield_for_foreignkey(db_field, self.request)
+            return db_field.formfield(**kwargs)
+
+        formset_class = modelformset_factory(
+            CloneTheme, fields=['font'], extra=extra,
+            formfield_callback=formfield_callback,
+        )
+        return str(formset_class(queryset=CloneTheme.objects.none()))
+
+    def test_forms_share_one_query_per_request(self):
+        class ThemeAdmin(TenantAdminMixin, admin.ModelAdmin):
+            pass
+
+        with self.assertNumQueries(1):
+            html = self._render_formset(ThemeAdmin(CloneTheme, admin.site))
+
+        self.assertEqual(html.count(f'<option value="{self.font_a.pk}"'), 5)
+        self.assertEqual(html.count(f'<option value="{self.font_b.pk}"'), 5)
+        self.assertNotIn(f'<option value="{self.font_c.pk}"', html)
+
+    def test_narrowed_queryset_is_respected(self):
+        class NarrowThemeAdmin(TenantAdminMixin, admin.ModelAdmin):
+            def formfield_for_foreignkey(self, db_field, request, **kwargs):
+                formfield = super().formfield_for_foreignkey(db_field, request, **kwargs)
+                formfield.queryset = formfield.queryset.filter(name='A')
+                return formfield
+
+        model_admin = NarrowThemeAdmin(CloneTheme, admin.site)
+        formfield = model_admin.formfield_for_foreignkey(
+            CloneTheme._meta.get_field('font'), self.request
+        )
+        choices = list(formfield.choices)
+        self.assertEqual([value.instance for value, label in choices[1:]], [self.font_a])
+        with self.assertRaises(ValidationError):
+            formfield.clean(self.font_b.pk)
+
+        html = self._render_formset(model_admin, extra=2)
+        self.assertEqual(html.count(f'<option value="{self.font_a.pk}"'), 2)
+        self.assertNotIn(f'<option value="{self.font_b.pk}"', html)
+
+
+class TopologicalSortTests(SimpleTestCase):
+
+    def test_dependencies_come_first(self):
+        # Theme's FK to itself is ignored; Font must be cloned before Theme
+        self.assertEqual(
+            _topological_sort_models([CloneTheme, CloneFont]), [CloneFont, CloneTheme]
+        )
+        self.assertEqual(
+            _topological_sort_models([CloneFont, CloneTheme]), [CloneFont, CloneTheme]
+        )
+
+    @isolate_apps('tenancy')
+    def test_order_is_depth_first_from_input_order(self):
+        class Alpha(models.Model):
+            pass
+
+        class Beta(models.Model):
+            pass
+
+        class Gamma(models.Model):
+            alpha = models.ForeignKey(Alpha, on_delete=models.CASCADE)
+
+        # Gamma pulls Alpha ahead of itself; Beta keeps its place after them
+        self.assertEqual(
+            _topological_sort_models([Gamma, Beta, Alpha]), [Alpha, Gamma, Beta]
+        )
+
+    @isolate_apps('tenancy')
+    def test_cycle_is_reported_with_its_members(self):
+        class Writer(models.Model):
+            editor = models.ForeignKey('Editor', on_delete=models.CASCADE)
+
+        class Editor(models.Model):
+            writer = models.ForeignKey(Writer, on_delete=models.CASCADE)
+
+        class Review(models.Model):
+            writer = models.ForeignKey(Writer, on_delete=models.CASCADE)
+
+        with self.assertRaisesMessage(
+            CyclicDependencyError,
+            'Cyclic dependency detected between models: Editor, Writer',
+        ):
+            _topological_sort_models([Review, Writer, Editor])
+
+
+class CloneTenantObjectsTests(TestModelsMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.template = Tenant.objects.create(name='Template', domain='template.test')
+        cls.target = Tenant.objects.create(name='Target', domain='target.test')
+        cls.font = CloneFont.objects.create(name='Serif', tenant=cls.template)
+        cls.base = CloneTheme.objects.create(name='Base', font=cls.font, tenant=cls.template)
+        cls.dark = CloneTheme.objects.create(
+            name='Dark', font=cls.font, parent=cls.base, tenant=cls.template
+        )
+
+    def _clone(self):
+        return clone_tenant_objects(
+            {
+                model: model.objects.all_tenants().filter(tenant=self.template)
+                for model in (CloneTheme, CloneFont)
+            },
+            self.target,
+        )
+
+    def test_foreign_keys_point_at_the_clones(self):
+        clone_map = self._clone()
+        font = clone_map[CloneFont][self.font.pk]
+        base = CloneTheme.objects.all_tenants().get(pk=clone_map[CloneTheme][self.base.pk].pk)
+        dark = CloneTheme.objects.all_tenants().get(pk=clone_map[CloneTheme][self.dark.pk].pk)
+
+        self.assertNotEqual(font.pk, self.font.pk)
+        self.assertEqual(
+            (base.tenant_id, base.font_id, base.parent_id),
+            (self.target.pk, font.pk, None),
+        )
+        self.assertEqual(
+            (dark.tenant_id, dark.font_id, dark.parent_id),
+            (self.target.pk, font.pk, base.pk),
+        )
+
+    def test_non_editable_fields_are_not_copied(self):
+        CloneFont.objects.all_tenants().filter(pk=self.font.pk).update(token='template')
+        clone_map = self._clone()
+        clone = CloneFont.objects.all_tenants().get(pk=clone_map[CloneFont][self.font.pk].pk)
+        self.assertEqual(clone.name, 'Serif')
+        self.assertEqual(clone.token, 'fresh')
+
+    def test_count_querysets_handles_sliced_and_distinct(self):
+        CloneFont.objects.create(name='Serif', tenant=self.target)
+        CloneFont.objects.create(name='Mono', tenant=self.target)
+        fonts = CloneFont.objects.all_tenants()
+        querysets = [
+            fonts,
+            fonts.order_by('pk')[:2],
+            fonts.values('name').distinct(),
+            CloneTheme.objects.all_tenants(),
+        ]
+        # One UNION ALL for the plain querysets, one count each for the rest
+        with self.assertNumQueries(3):
+            counts = _count_querysets(querysets)
+        self.assertEqual(counts, {0: 3, 1: 2, 2: 2, 3: 2})
+
+
+class CloneTransactionTests(TestModelsMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.template = Tenant.objects.create(name='Template', domain='template.test')
+        cls.target = Tenant.objects.create(name='Target', domain='target.test')
+        CloneFont.objects.create(name='A', tenant=cls.template)
+
+    def _template_querysets(self):
+        return {CloneFont: CloneFont.objects.all_tenants().filter(tenant=self.template)}
+
+    def test_clone_error_leaves_callers_transaction_usable(self):
+        with transaction.atomic():
+            with self.assertRaises(CloneError):
+                clone_tenant_objects(
+                    self._template_querysets(), self.target,
+                    field_overrides={CloneFont: {'name': None}},
+                )
+            # The clone's savepoint was rolled back, not the caller's block
+            self.assertEqual(Tenant.objects.count(), 2)
+
+    def test_per_model_commits_warn_inside_a_transaction(self):
+        with self.assertLogs('tenancy.utils', level='WARNING') as logs:
+            clone_map = clone_tenant_objects(
+                self._template_querysets(), self.target, single_transaction=False,
+            )
+        self.assertIn('single_transaction=False', logs.output[0])
+        self.assertEqual(len(clone_map[CloneFont]), 1)
+
+
+class TenancyRoleManagerTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Acme', domain='acme.test')
+        cls.user = get_user_model().objects.create(username='manager')
+
+    def setUp(self):
+        roles.assign_role(self.user, TenancyRole.TENANT_MANAGER, self.tenant)
+
+    def test_post_delete_receivers_fire(self):
+        deleted = []
+
+        def receiver(sender, instance, **kwargs):
+            deleted.append(instance.role)
+
+        post_delete.connect(receiver, sender=TenancyRole)
+        self.addCleanup(post_delete.disconnect, receiver, sender=TenancyRole)
+
+        self.assertEqual(
+            roles.revoke_role(self.user, TenancyRole.TENANT_MANAGER, self.tenant), 1
+        )
+        self.assertEqual(deleted, [TenancyRole.TENANT_MANAGER])
+
+    def test_postgresql_assign_is_idempotent_and_invalidates(self):
+        other = Tenant.objects.create(name='Other', domain='other.test')
+        self.assertFalse(roles.is_tenant_manager(self.user, other))
+
+        with mock.patch.object(connection, 'vendor', 'postgresql'), \
+                mock.patch('tenancy.roles._invalidate_admin_cache') as invalidate:
+            first = roles.assign_role(self.user, TenancyRole.TENANT_MANAGER, other)
+            second = roles.assign_role(self.user, TenancyRole.TENANT_MANAGER, other)
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(
+            TenancyRole.objects.filter(user=self.user, tenant=other).count(), 1
+        )
+        invalidate.assert_called_with([self.user.pk])
+        # The per-user role cache was cleared as well
+        self.assertTrue(roles.is_tenant_manager(self.user, other))
+
+    def test_single_delete_without_receivers(self):
+        with self.assertNumQueries(1):
+            deleted = roles.revoke_role(self.user, TenancyRole.TENANT_MANAGER, self.tenant)
+        self.assertEqual(deleted, 1)
+        self.assertFalse(TenancyRole.objects.exists())
+
+
+@override_settings(TENANCY_WARNING_SUMMARY='atexit')
+class WarningSiteCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        # Fresh module state, so nothing reaches the real atexit summary
+        for name, value in (
+            ('_TENANCY_WARN_CACHE', OrderedDict()),
+            ('_TENANCY_WARN_EVICTED', set()),
+            ('_TENANCY_WARN_MAX_SITES', 2),
+            ('_TENANCY_CALLER_SEEN', set()),
+            ('_TENANCY_FAST_SEEN', set()),
+            ('_TENANCY_PRECHECK_KEYS', {}),
+        ):
+            patcher = mock.patch.object(tenancy_warnings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        catcher = warnings.catch_warnings()
+        catcher.__enter__()
+        self.addCleanup(catcher.__exit__, None, None, None)
+        warnings.simplefilter('always')
+
+        # One call site per function, outside the tenancy package
+        source = "\n".join(
+            f"def site{i}():\n    warn_missing_tenant(CloneFont)" for i in range(3)
+        )
+        self.sites = {
+            'warn_missing_tenant': tenancy_warnings.warn_missing_tenant,
+            'CloneFont': CloneFont,
+        }
+        exec(compile(source, '/sites/app.py', 'exec'), self.sites)
+
+    def _cached_lines(self):
+        return [lineno for _, _, lineno in tenancy_warnings._TENANCY_WARN_CACHE]
+
+    def test_repeat_site_is_recorded_once(self):
+        for _ in range(3):
+            self.sites['site0']()
+        self.assertEqual(self._cached_lines(), [2])
+        self.assertFalse(tenancy_warnings._TENANCY_WARN_EVICTED)
+
+    def test_evicted_site_is_relisted_not_double_counted(self):
+        for name in ('site0', 'site1', 'site2'):
+            self.sites[name]()
+        self.assertEqual(self._cached_lines(), [4, 6])
+        self.assertEqual(len(tenancy_warnings._TENANCY_WARN_EVICTED), 1)
+
+        # site0 was evicted with its pre-check keys, so it is queued again
+        # and pushes site1 out; still one site elided, not two
+        self.sites['site0']()
+        self.assertEqual(self._cached_lines(), [6, 2])
+        self.assertEqual(
+            tenancy_warnings._TENANCY_WARN_EVICTED, {('tenancy.CloneFont', '/sites/app.py', 4)}
+        )
+        self.assertEqual(len(tenancy_warnings._TENANCY_FAST_SEEN), 2)
+        self.assertEqual(len(tenancy_warnings._TENANCY_CALLER_SEEN), 2)
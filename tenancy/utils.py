@@ -11,15 +11,29 @@ Supports three cloning modes:
 """
 
 import logging
-from collections import defaultdict, deque
+import uuid
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional, Any, Type, Set
-from django.db import models, transaction
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, models, router, transaction
+from django.db.models import signals
 from django.apps import apps
-from django.forms.models import model_to_dict
+from django.conf import settings
+from django.utils import timezone
+
+from .mixins import TenantMixin, _get_bootstrap_tenant_pk
 
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched and inserted per round trip when cloning; override with the
+# TENANCY_CLONE_BATCH_SIZE setting
+CLONE_BATCH_SIZE = 1000
+
 
 class CloneError(Exception):
     """Base exception for cloning operations."""
@@ -39,149 +53,359 @@ def clone_tenant_objects(
     querysets: Dict[Type[models.Model], models.QuerySet],
     new_tenant,
     field_overrides: Optional[Dict[Type[models.Model], Dict[str, Any]]] = None,
+    single_transaction: bool = True,
+    savepoint: bool = True,
 ) -> Dict[Type[models.Model], Dict[int, models.Model]]:
     """
     Clone objects from multiple models in topological order, respecting FK dependencies.
+
+    By default all inserts run in one atomic block. Inside a caller's
+    transaction that block is a savepoint, so a caller can catch CloneError
+    and keep using its transaction. Callers that let any failure abort their
+    whole transaction anyway (as TenantProvisioner does) can pass
+    ``savepoint=False`` to skip the SAVEPOINT/RELEASE round trips. No per-model
+    or per-row savepoints are created.
+
+    With ``single_transaction=False`` and no enclosing transaction, each model
+    is committed on its own instead. Locks and undo/WAL are then held for one
+    model at a time, but a failure leaves the models cloned so far in place.
+    The flag only helps outside a transaction: inside one (e.g. under
+    TenantProvisioner's @transaction.atomic) nothing commits until the caller's
+    block ends and a failure still aborts it, so a warning is logged.
     """
     field_overrides = field_overrides or {}
 
     # Build dependency graph and perform topological sort
-    models_to_clone = list(querysets.keys())
-    sorted_models = _topological_sort_models(models_to_clone)
+    sorted_models = _get_clone_order(tuple(querysets))
 
-    logger.info(f"Cloning models in order: {[m.__name__ for m in sorted_models]}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Cloning models in order: %s", [m.__name__ for m in sorted_models])
 
     # Store mapping of old object IDs to new cloned instances
     # Structure: {Model: {old_id: new_instance}}
-    clone_map: Dict[Type[models.Model], Dict[int, models.Model]] = defaultdict(dict)
+    clone_map: Dict[Type[models.Model], Dict[int, models.Model]] = {}
+    # Same keys, mapped to the new primary keys; FK resolution only needs these
+    # Structure: {Model: {old_id: new_pk}}
+    clone_pks: Dict[Type[models.Model], Dict[int, Any]] = {}
+
+    batch_size = getattr(settings, 'TENANCY_CLONE_BATCH_SIZE', CLONE_BATCH_SIZE)
+
+    if not single_transaction and any(
+        transaction.get_connection(router.db_for_write(model)).in_atomic_block
+        for model in sorted_models
+    ):
+        logger.warning(
+            "clone_tenant_objects(single_transaction=False) was called inside a "
+            "transaction; models are not committed one at a time and a failure "
+            "still aborts the enclosing transaction"
+        )
 
-    with transaction.atomic():
-        # Clone models in topological order
+    # Models are cloned one after another on this thread's connection. Running
+    # independent models in worker threads would put each on its own connection
+    # and outside this transaction, so a failure could leave a half-cloned tenant.
+    with transaction.atomic(savepoint=savepoint) if single_transaction else nullcontext():
+        # Clone models in topological order (the order holds exactly the
+        # models in querysets)
         for model in sorted_models:
-            if model not in querysets:
-                # Skip models that weren't requested for cloning
+            plan = _get_clone_plan(model)
+            if plan.mode == 'none':
+                logger.info("Skipping %s - CLONE_MODE='none'", model.__name__)
                 continue
 
-            clone_mode = _get_clone_mode(model)
-            if clone_mode == 'none':
-                logger.info(f"Skipping {model.__name__} - CLONE_MODE='none'")
-                continue
+            logger.info("Cloning %s using mode: %s", model.__name__, plan.mode)
+
+            with nullcontext() if single_transaction else transaction.atomic(savepoint=False):
+                model_clones = _clone_model(
+                    model,
+                    querysets[model],
+                    new_tenant,
+                    field_overrides.get(model, {}),
+                    plan,
+                    clone_pks,
+                    batch_size,
+                )
+
+            if model_clones:
+                clone_map[model] = model_clones
 
-            queryset = querysets[model]
-            overrides = field_overrides.get(model, {})
+    logger.info("Successfully cloned objects across %d models", len(clone_map))
+    return clone_map
 
-            # Check and log cloning mode for this model
-            clone_mode = _get_clone_mode(model)
-            logger.info(
-                f"Cloning {queryset.count()} objects for {model.__name__} "
-                f"using mode: {clone_mode}"
+
+def _clone_model(
+    model: Type[models.Model],
+    queryset: models.QuerySet,
+    new_tenant,
+    overrides: Dict[str, Any],
+    plan: '_ClonePlan',
+    clone_pks: Dict[Type[models.Model], Dict[int, Any]],
+    batch_size: int,
+) -> Dict[int, models.Model]:
+    """
+    Clone every row of ``queryset`` and return ``{old_id: new_instance}``.
+
+    The model's ``{old_id: new_pk}`` map is registered in ``clone_pks`` up
+    front, so self-referential rows can resolve parents cloned earlier in the
+    same loop.
+    """
+    use_bulk = _can_bulk_clone(model)
+    pending = []
+    model_clones = {}
+    model_pks = clone_pks[model] = {}
+
+    # Stream template rows instead of caching the whole queryset;
+    # bulk clones are flushed every batch_size rows. Skeleton clones
+    # copy nothing from the template row, so only its pk is read.
+    if plan.skeleton:
+        rows = queryset.values_list('pk', flat=True).iterator(chunk_size=batch_size)
+    else:
+        rows = queryset.iterator(chunk_size=batch_size)
+
+    for row in rows:
+        original_id = row if plan.skeleton else row.id
+        try:
+            # Clone the object and store the mapping
+            if plan.skeleton:
+                new_obj = _build_skeleton_clone(model, new_tenant, overrides, plan)
+            else:
+                new_obj = _clone_single_object(
+                    row,
+                    new_tenant,
+                    clone_pks,
+                    overrides,
+                    plan,
+                )
+            if not use_bulk:
+                new_obj.save(force_insert=True)
+                model_clones[original_id] = new_obj
+                model_pks[original_id] = new_obj.pk
+                continue
+
+        except Exception as e:
+            logger.error(
+                "Failed to clone %s with id=%s: %s",
+                model.__name__, original_id, e,
             )
+            raise CloneError(
+                f"Failed to clone {model.__name__} (id={original_id})"
+            ) from e
+
+        # Batch flushes raise their own CloneError covering the batch,
+        # rather than blaming the row that happened to fill it
+        pending.append((original_id, new_obj))
+        if plan.client_pk:
+            # The pk is already known, so later rows (including
+            # self-references) can point at this clone before the flush
+            model_pks[original_id] = new_obj.pk
+        if len(pending) >= batch_size:
+            _bulk_create_clones(model, pending, model_clones, model_pks)
+            pending = []
+
+    if pending:
+        _bulk_create_clones(model, pending, model_clones, model_pks)
+
+    return model_clones
+
+
+def _bulk_create_clones(
+    model: Type[models.Model],
+    pending: List[tuple],
+    model_clones: Dict[int, models.Model],
+    model_pks: Dict[int, Any],
+) -> None:
+    """
+    Insert a batch of unsaved clones and record them in the model's clone maps.
 
-            for original_obj in queryset:
-                try:
-                    # Clone the object and store the mapping
-                    new_obj = _clone_single_object(
-                        original_obj,
-                        new_tenant,
-                        clone_map,
-                        overrides
-                    )
-                    clone_map[model][original_obj.id] = new_obj
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to clone {model.__name__} with id={original_obj.id}: {e}"
-                    )
-                    raise CloneError(
-                        f"Failed to clone {model.__name__} (id={original_obj.id})"
-                    ) from e
-
-    logger.info(f"Successfully cloned objects across {len(clone_map)} models")
-    return dict(clone_map)
+    ``pending`` holds ``(original_id, new_obj)`` pairs.
+    """
+    try:
+        model._base_manager.bulk_create([new_obj for _, new_obj in pending])
+    except Exception as e:
+        logger.error("Failed to bulk clone %s: %s", model.__name__, e)
+        raise CloneError(
+            f"Failed to clone {model.__name__} ({len(pending)} objects)"
+        ) from e
+
+    model_clones.update(pending)
+    model_pks.update((original_id, new_obj.pk) for original_id, new_obj in pending)
 
 
 # ============================================================================
 # SINGLE OBJECT CLONING WITH MODE SUPPORT
 # ============================================================================
 
-def _clone_single_object(
-    original_obj: models.Model,
-    new_tenant,
-    clone_map: Dict[Type[models.Model], Dict[int, models.Model]],
-    field_overrides: Dict[str, Any],
-) -> models.Model:
+@dataclass(frozen=True)
+class _ClonePlan:
     """
-    Clone a single object, respecting the model's cloning mode and metadata.
+    Per-model cloning metadata, read from the model class once rather than
+    once per cloned row.
     """
-    model_class = original_obj.__class__
+    mode: str
+    exclude_fields: tuple
+    field_overrides: Optional[Dict[str, Any]]
+    skeleton: bool
+    extractor: Any  # copies the clone attnames of an instance into a dict
+    client_pk: bool  # pk comes from a Python-side default (e.g. uuid4)
+    fk_specs: tuple  # (field, attname, related_model) per non-tenant FK
+
+
+@lru_cache(maxsize=None)
+def _fk_fields(model_class: Type[models.Model]) -> tuple:
+    """
+    Non-tenant ForeignKey fields of ``model_class``, shared by the dependency
+    sort and FK resolution.
+    """
+    return tuple(
+        field for field in model_class._meta.concrete_fields
+        if isinstance(field, models.ForeignKey) and field.name != 'tenant'
+    )
 
-    # Get exclude fields from the model or use defaults
-    exclude_fields = getattr(model_class, 'CLONE_EXCLUDE_FIELDS', ('id', 'pk'))
 
-    # Determine cloning mode and check for metadata conflicts
+@lru_cache(maxsize=None)
+def _get_clone_plan(model_class: Type[models.Model]) -> _ClonePlan:
+    # Model classes don't change while the process runs, so one plan per
+    # model is built and kept for the life of the process.
     has_field_overrides = hasattr(model_class, 'CLONE_FIELD_OVERRIDES')
     has_clone_mode = hasattr(model_class, 'CLONE_MODE')
 
     # Warn if both metadata types exist
     if has_field_overrides and has_clone_mode:
         logger.warning(
-            f"{model_class.__name__}: Both CLONE_MODE and CLONE_FIELD_OVERRIDES "
-            f"are defined. CLONE_FIELD_OVERRIDES takes precedence. "
-            f"CLONE_MODE='{model_class.CLONE_MODE}' is being IGNORED."
-        )
-        print(
-            f"⚠️  WARNING: {model_class.__name__} has both CLONE_MODE and "
-            f"CLONE_FIELD_OVERRIDES defined. Using CLONE_FIELD_OVERRIDES only."
+            "%s: Both CLONE_MODE and CLONE_FIELD_OVERRIDES are defined. "
+            "CLONE_FIELD_OVERRIDES takes precedence. CLONE_MODE='%s' is being IGNORED.",
+            model_class.__name__, model_class.CLONE_MODE,
         )
 
+    mode = _get_clone_mode(model_class)
+    exclude_fields = tuple(getattr(model_class, 'CLONE_EXCLUDE_FIELDS', ('id', 'pk')))
+    return _ClonePlan(
+        mode=mode,
+        exclude_fields=exclude_fields,
+        field_overrides=model_class.CLONE_FIELD_OVERRIDES if has_field_overrides else None,
+        # _get_clone_mode() normalizes CLONE_MODE and gives field overrides
+        # precedence, so this matches the mode that gets logged
+        skeleton=mode == 'skeleton',
+        extractor=_get_field_extractor(model_class, exclude_fields),
+        client_pk=model_class._meta.pk.has_default(),
+        fk_specs=tuple(
+            (field, field.attname, field.related_model)
+            for field in _fk_fields(model_class)
+        ),
+    )
+
+
+def _clone_single_object(
+    original_obj: models.Model,
+    new_tenant,
+    clone_pks: Dict[Type[models.Model], Dict[int, Any]],
+    field_overrides: Dict[str, Any],
+    plan: Optional[_ClonePlan] = None,
+) -> models.Model:
+    """
+    Build an unsaved clone of a single object, respecting the model's
+    cloning mode and metadata. The caller is responsible for saving it.
+    """
+    model_class = original_obj.__class__
+    if plan is None:
+        plan = _get_clone_plan(model_class)
+
+    if plan.skeleton:
+        # Mode 2: Skeleton clone - nothing is read from the original
+        return _build_skeleton_clone(model_class, new_tenant, field_overrides, plan)
+
     # Extract field data based on cloning mode
-    if has_field_overrides:
+    if plan.field_overrides is not None:
         # Mode 3: Field-level overrides
         data = _extract_fields_with_model_overrides(
             original_obj,
-            exclude_fields,
-            model_class.CLONE_FIELD_OVERRIDES
+            plan.exclude_fields,
+            plan.field_overrides
         )
-        logger.debug(
-            f"Using CLONE_FIELD_OVERRIDES for {model_class.__name__}: "
-            f"{model_class.CLONE_FIELD_OVERRIDES}"
-        )
-    elif has_clone_mode and model_class.CLONE_MODE == 'skeleton':
-        # Mode 2: Skeleton clone
-        data = _extract_fields_skeleton_mode(original_obj, exclude_fields)
-        logger.debug(f"Using skeleton mode for {model_class.__name__}")
     else:
         # Mode 1: Full clone (default)
-        data = model_to_dict(original_obj, exclude=exclude_fields)
-        logger.debug(f"Using full clone mode for {model_class.__name__}")
+        data = plan.extractor(original_obj)
 
     # Process foreign key fields - resolve references to cloned objects
-    # This happens AFTER initial extraction but BEFORE overrides
-    data = _resolve_foreign_keys(
-        original_obj,
-        model_class,
-        data,
-        clone_map,
-        skip_fk_resolution=(has_field_overrides or
-                           (has_clone_mode and model_class.CLONE_MODE == 'skeleton'))
-    )
+    # This happens AFTER initial extraction but BEFORE overrides. Override
+    # clones keep their copied/overridden FK values as they are.
+    if plan.field_overrides is None and plan.fk_specs:
+        _resolve_foreign_keys(
+            original_obj,
+            model_class,
+            data,
+            clone_pks,
+            fk_specs=plan.fk_specs,
+        )
 
     # Set the new tenant
     data['tenant'] = new_tenant
 
     # Apply any runtime field overrides (these override everything)
-    data.update(field_overrides)
+    if field_overrides:
+        _apply_field_overrides(model_class, data, field_overrides)
 
-    # Create the new object
-    new_obj = model_class.objects.create(**data)
+    new_obj = model_class(**data)
 
-    logger.debug(
-        f"Cloned {model_class.__name__}(id={original_obj.id}) -> (id={new_obj.id})"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Built clone of %s(id=%s)", model_class.__name__, original_obj.id)
 
     return new_obj
 
 
+def _build_skeleton_clone(
+    model_class: Type[models.Model],
+    new_tenant,
+    field_overrides: Dict[str, Any],
+    plan: _ClonePlan,
+) -> models.Model:
+    """
+    Build an unsaved skeleton clone of ``model_class``. Skeleton clones take
+    only defaults, so no template row is needed.
+    """
+    data = _extract_fields_skeleton_mode(model_class, plan.exclude_fields)
+
+    # Set the new tenant
+    data['tenant'] = new_tenant
+
+    # Apply any runtime field overrides (these override everything)
+    _apply_field_overrides(model_class, data, field_overrides)
+
+    return model_class(**data)
+
+
+def _can_bulk_clone(model_class) -> bool:
+    """
+    Check whether clones of a model can be inserted with bulk_create().
+
+    bulk_create() bypasses save() and the pre/post_save signals, cannot insert
+    multi-table inherited models, and only sets database-generated primary keys
+    on backends that return rows from bulk inserts (not MySQL). Models whose
+    primary key has a Python-side default, such as a UUIDField, already carry
+    their pk and can be bulk inserted anywhere. Self-referential models with
+    database-generated keys also need each row saved before the next one can
+    point at it. In any of those cases clones are saved one at a time instead.
+    """
+    connection = connections[router.db_for_write(model_class)]
+    if (
+        not connection.features.can_return_rows_from_bulk_insert
+        and not model_class._meta.pk.has_default()
+    ):
+        return False
+
+    if model_class.save is not TenantMixin.save or model_class._meta.parents:
+        return False
+
+    if signals.pre_save.has_listeners(model_class) or signals.post_save.has_listeners(model_class):
+        return False
+
+    if not model_class._meta.pk.has_default():
+        for field in _fk_fields(model_class):
+            if field.related_model is model_class:
+                return False
+
+    return True
+
+
 # ============================================================================
 # FIELD EXTRACTION HELPERS
 # ============================================================================
@@ -195,49 +419,170 @@ def _extract_fields_with_model_overrides(
     Extract fields and apply model-level CLONE_FIELD_OVERRIDES.
     """
     # Start with full clone
-    data = model_to_dict(original_obj, exclude=exclude_fields)
+    data = _copy_field_values(original_obj, exclude_fields)
 
     # Apply model-level overrides
-    for field_name, override_value in clone_field_overrides.items():
-        data[field_name] = override_value
-        logger.debug(
-            f"Override {original_obj.__class__.__name__}.{field_name} = {override_value}"
-        )
+    _apply_field_overrides(original_obj.__class__, data, clone_field_overrides)
+    if logger.isEnabledFor(logging.DEBUG):
+        for field_name, override_value in clone_field_overrides.items():
+            logger.debug(
+                "Override %s.%s = %s",
+                original_obj.__class__.__name__, field_name, override_value,
+            )
 
     return data
 
 
-# Sentinel used by _get_skeleton_default_for_field to mean
+@lru_cache(maxsize=None)
+def _get_clone_attnames(model_class: Type[models.Model], exclude_fields) -> tuple:
+    """
+    Return the attnames copied when cloning ``model_class``, computed once per model.
+
+    Matches what model_to_dict() used to copy: non-editable fields are left
+    out (this includes auto_now/auto_now_add timestamps, which pre_save()
+    fills on insert), as are the primary key, the tenant and any excluded fields.
+    """
+    return tuple(
+        field.attname
+        for field in model_class._meta.concrete_fields
+        if field.editable
+        and not field.primary_key
+        and field.name != 'tenant'
+        and field.name not in exclude_fields
+        and field.attname not in exclude_fields
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_clone_only_fields(model_class: Type[models.Model]) -> tuple:
+    """
+    Return the field names a clone of ``model_class`` reads from the original row.
+
+    Used with ``QuerySet.only()`` so template rows don't load columns the clone
+    never copies. Skeleton clones read nothing but the primary key.
+    """
+    plan = _get_clone_plan(model_class)
+    if plan.skeleton:
+        return ('pk',)
+
+    attnames = set(_get_clone_attnames(model_class, plan.exclude_fields))
+    fk_fields = _fk_fields(model_class)
+    return tuple(
+        field.name
+        for field in model_class._meta.concrete_fields
+        if field.attname in attnames
+        # _resolve_foreign_keys reads every FK, excluded or not
+        or field in fk_fields
+    )
+
+
+def _copy_field_values(original_obj: models.Model, exclude_fields: tuple) -> Dict[str, Any]:
+    """
+    Copy the raw column values of a model instance, keyed by attname.
+
+    Foreign keys are copied as their ``<name>_id`` value, so no related rows are
+    fetched. The primary key, the tenant and any excluded fields are left out.
+    """
+    return _get_field_extractor(type(original_obj), exclude_fields)(original_obj)
+
+
+@lru_cache(maxsize=None)
+def _get_field_extractor(model_class: Type[models.Model], exclude_fields: tuple):
+    """
+    Return a function that copies the clone attnames of a ``model_class``
+    instance into a new dict, built once per model.
+    """
+    attnames = _get_clone_attnames(model_class, exclude_fields)
+    if not attnames:
+        return lambda obj: {}
+
+    getter = attrgetter(*attnames)
+    if len(attnames) == 1:
+        # attrgetter with a single name returns the bare value
+        attname = attnames[0]
+        return lambda obj: {attname: getter(obj)}
+    return lambda obj: dict(zip(attnames, getter(obj)))
+
+
+def _apply_field_overrides(
+    model_class: Type[models.Model],
+    data: Dict[str, Any],
+    overrides: Dict[str, Any],
+) -> None:
+    """
+    Apply field overrides to extracted data in place.
+
+    Overrides are keyed by field name, while copied values are keyed by attname.
+    When a foreign key is overridden by name, its copied ``<name>_id`` value is
+    dropped so the two don't conflict.
+    """
+    for field_name, value in overrides.items():
+        attname = _get_override_attname(model_class, field_name)
+        if attname is not None:
+            data.pop(attname, None)
+        data[field_name] = value
+
+
+@lru_cache(maxsize=None)
+def _get_override_attname(model_class: Type[models.Model], field_name: str) -> Optional[str]:
+    """
+    Return the attname an override of ``field_name`` replaces, when it differs
+    from the name (e.g. ``theme_id`` for ``theme``), else None.
+    """
+    try:
+        attname = model_class._meta.get_field(field_name).attname
+    except (FieldDoesNotExist, AttributeError):
+        return None
+    return attname if attname != field_name else None
+
+
+# Sentinel used by _get_skeleton_default_factory to mean
 # "I don't know how to generate a safe default for this field".
 _SKEL_UNSET = object()
 
-def _extract_fields_skeleton_mode(original_obj, exclude_fields):
-    model_class = original_obj.__class__
-    data = {}
-
-    for field in model_class._meta.get_fields():
-        if (
-            field.name in exclude_fields
-            or not hasattr(field, "get_attname")
-            or field.many_to_many
-        ):
-            continue
 
+def _extract_fields_skeleton_mode(model_class, exclude_fields):
+    template, factories = _get_skeleton_plan(model_class, exclude_fields)
+    data = dict(template)
+    for field_name, factory in factories:
+        data[field_name] = factory()
+    return data
+
+
+@lru_cache(maxsize=None)
+def _get_skeleton_plan(model_class, exclude_fields) -> tuple:
+    """
+    Return ``(template, factories)`` for a skeleton clone of ``model_class``.
+
+    ``template`` holds the immutable defaults, computed once per model and
+    shallow-copied per row. ``factories`` are ``(field_name, factory)`` pairs
+    for values that must be fresh per row (uuid4, now, callable defaults,
+    empty JSON objects).
+    """
+    template = {}
+    factories = []
+    # concrete_fields already leaves out reverse relations and many-to-many
+    for field in model_class._meta.concrete_fields:
         field_name = field.name
-        if field_name == "tenant":
+        if field_name in exclude_fields or field_name == "tenant":
             continue
 
         # Let Django handle auto-managed timestamps by omitting them.
         if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
             continue
 
-        default_value = _get_skeleton_default_for_field(field)
-        if default_value is not _SKEL_UNSET:
-            data[field_name] = default_value
+        factory = _get_skeleton_default_factory(field)
+        if factory is not _SKEL_UNSET:
+            if factory in _SKELETON_CONSTANT_FACTORIES or (
+                factory == field.get_default and not callable(field.default)
+            ):
+                template[field_name] = factory()
+            else:
+                factories.append((field_name, factory))
             continue
 
         if getattr(field, "null", False):
-            data[field_name] = None
+            template[field_name] = None
             continue
 
         raise CloneError(
@@ -246,155 +591,140 @@ def _extract_fields_skeleton_mode(original_obj, exclude_fields):
             f"Add a model default, make it nullable, or provide CLONE_FIELD_OVERRIDES."
         )
 
-    return data
-
-
-def _get_skeleton_default_for_field(field) -> Any:
-    if field.has_default():
-        return field.get_default()
-
-    if isinstance(field, (models.CharField, models.TextField, models.SlugField, models.EmailField, models.URLField)):
-        return ""
-
-    if isinstance(field, models.UUIDField):
-        return uuid.uuid4()
-
-    if isinstance(field, (models.IntegerField, models.BigIntegerField, models.SmallIntegerField,
-                          models.PositiveIntegerField, models.PositiveSmallIntegerField)):
-        return 0
+    return template, tuple(factories)
 
-    if isinstance(field, (models.FloatField, models.DecimalField)):
-        return 0
 
-    if isinstance(field, models.BooleanField):
-        return False
+def _ip_placeholder():
+    return "0.0.0.0"
 
-    if isinstance(field, models.BinaryField):
-        return b""
 
-    if isinstance(field, models.DurationField):
-        return timedelta(0)
+# Factories whose results are immutable, so one value can be shared by all rows
+_SKELETON_CONSTANT_FACTORIES = frozenset({str, int, bool, bytes, timedelta, _ip_placeholder})
 
-    if isinstance(field, models.ForeignKey):
-        return _SKEL_UNSET
 
-    if isinstance(field, models.DateTimeField):
-        return timezone.now()
-    if isinstance(field, models.DateField):
-        return timezone.localdate()
-    if isinstance(field, models.TimeField):
-        return timezone.localtime().time()
+def _time_now():
+    return timezone.localtime().time()
 
-    if isinstance(field, models.JSONField):
-        return {}
 
-    if isinstance(field, models.GenericIPAddressField):
-        return "0.0.0.0"
+# Field type -> default factory. Subclasses not listed here resolve through
+# their MRO in _get_skeleton_default_factory(), and the result is memoized.
+_SKELETON_FACTORY_BY_TYPE = {
+    models.CharField: str,
+    models.TextField: str,
+    models.SlugField: str,
+    models.EmailField: str,
+    models.URLField: str,
+    models.UUIDField: uuid.uuid4,
+    models.IntegerField: int,
+    models.BigIntegerField: int,
+    models.SmallIntegerField: int,
+    models.PositiveIntegerField: int,
+    models.PositiveSmallIntegerField: int,
+    models.FloatField: int,
+    models.DecimalField: int,
+    models.BooleanField: bool,
+    models.BinaryField: bytes,
+    models.DurationField: timedelta,
+    models.ForeignKey: _SKEL_UNSET,
+    models.DateTimeField: timezone.now,
+    models.DateField: timezone.localdate,
+    models.TimeField: _time_now,
+    models.JSONField: dict,
+    models.GenericIPAddressField: _ip_placeholder,
+}
 
-    return _SKEL_UNSET
 
+def _get_skeleton_default_factory(field) -> Any:
+    if field.has_default():
+        return field.get_default
+
+    field_type = type(field)
+    factory = _SKELETON_FACTORY_BY_TYPE.get(field_type)
+    if factory is None:
+        # Nearest listed base class wins, so e.g. DateTimeField is matched
+        # before its DateField base
+        factory = next(
+            (
+                _SKELETON_FACTORY_BY_TYPE[base]
+                for base in field_type.__mro__[1:]
+                if base in _SKELETON_FACTORY_BY_TYPE
+            ),
+            _SKEL_UNSET,
+        )
+        _SKELETON_FACTORY_BY_TYPE[field_type] = factory
+    return factory
 
 
 def _resolve_foreign_keys(
     original_obj: models.Model,
     model_class: Type[models.Model],
     data: Dict[str, Any],
-    clone_map: Dict[Type[models.Model], Dict[int, models.Model]],
-    skip_fk_resolution: bool = False
+    clone_pks: Dict[Type[models.Model], Dict[int, Any]],
+    fk_specs: Optional[tuple] = None,
 ) -> Dict[str, Any]:
     """
     Resolve foreign key fields to point to newly cloned objects.
 
     For each FK field:
     1. Check if the related object has been cloned
-    2. If yes, update the FK to point to the cloned instance
+    2. If yes, set the FK's attname to the clone's pk
     3. If no, keep the original FK (with warning)
 
     Args:
         original_obj: The original object being cloned
         model_class: The model class
         data: Dictionary of field values (will be modified)
-        clone_map: Map of cloned objects
-        skip_fk_resolution: If True, don't resolve FKs (for skeleton/override modes)
+        clone_pks: Map of original ids to cloned pks, per model
+        fk_specs: The model's (field, attname, related_model) FK triples, if already known
 
     Returns:
         Updated data dictionary with resolved FKs
     """
-    try:
-        all_fields = model_class._meta.get_fields()
-    except Exception as e:
-        logger.error(f"Error getting fields for {model_class.__name__}: {e}")
-        return data
-
-    for field in all_fields:
-        # Check if this is a ForeignKey field
-        try:
-            if not isinstance(field, models.ForeignKey):
-                continue
-        except Exception as e:
-            logger.warning(
-                f"Skipping field in {model_class.__name__} during FK resolution: {e}. "
-                f"Field type: {type(field)}"
-            )
-            continue
+    if fk_specs is None:
+        fk_specs = _get_clone_plan(model_class).fk_specs
 
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for field, attname, related_model in fk_specs:
         field_name = field.name
 
-        # Skip the tenant field - handled separately
-        if field_name == 'tenant':
-            continue
-
-        # If using skeleton mode or field overrides, skip FK resolution
-        # (fields are already set to None or override values)
-        if skip_fk_resolution:
-            continue
-
         # Get the original related object ID
-        try:
-            original_fk_id = getattr(original_obj, f"{field_name}_id", None)
-        except Exception as e:
-            logger.warning(f"Could not get FK ID for {field_name}: {e}")
-            continue
+        original_fk_id = getattr(original_obj, attname)
 
         if original_fk_id is None:
             # FK is null, keep it null
-            data[field_name] = None
-            continue
-
-        # Get the related model
-        try:
-            related_model = field.related_model
-        except Exception as e:
-            logger.warning(f"Could not get related_model for {field_name}: {e}")
+            data[attname] = None
             continue
 
-        # Check if we've already cloned this related object
-        if related_model in clone_map and original_fk_id in clone_map[related_model]:
-            # Use the cloned instance
-            data[field_name] = clone_map[related_model][original_fk_id]
-            logger.debug(
-                f"Resolved FK {field_name} for {model_class.__name__}: "
-                f"{original_fk_id} -> {data[field_name].id}"
-            )
+        # Check if we've already cloned this related object (one lookup per
+        # level of the map)
+        related_pks = clone_pks.get(related_model)
+        new_pk = related_pks.get(original_fk_id) if related_pks else None
+        if new_pk is not None:
+            # Point at the clone by its pk; assigning the raw attname skips the
+            # FK descriptor (related models are saved before their dependents)
+            data[attname] = new_pk
+            if debug:
+                logger.debug(
+                    "Resolved FK %s for %s: %s -> %s",
+                    field_name, model_class.__name__, original_fk_id, new_pk,
+                )
         else:
             # Related object hasn't been cloned yet
             # This shouldn't happen if topological sort worked correctly
             logger.warning(
-                f"FK {field_name} references {related_model.__name__}(id={original_fk_id}) "
-                f"which hasn't been cloned yet. This may indicate a missing dependency "
-                f"or the related object wasn't included in the cloning queryset."
+                "FK %s references %s(id=%s) which hasn't been cloned yet. This may "
+                "indicate a missing dependency or the related object wasn't included "
+                "in the cloning queryset.",
+                field_name, related_model.__name__, original_fk_id,
             )
             # Keep the original FK value - this may cause issues if the
             # referenced object doesn't exist in the new tenant
-            try:
-                data[field_name] = getattr(original_obj, field_name)
-            except Exception as e:
-                logger.error(f"Could not get original FK value for {field_name}: {e}")
-                data[field_name] = None
+            data[attname] = original_fk_id
 
     return data
 
 
+@lru_cache(maxsize=None)
 def _get_clone_mode(model_class) -> str:
     if hasattr(model_class, 'CLONE_FIELD_OVERRIDES'):
         return 'field_overrides'
@@ -419,6 +749,15 @@ def _get_clone_mode(model_class) -> str:
 # TOPOLOGICAL SORTING FOR DEPENDENCY RESOLUTION
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _get_clone_order(models_to_clone: tuple) -> tuple:
+    """
+    Topological clone order for ``models_to_clone``, computed once per distinct
+    set of models (every provisioning normally clones the same ones).
+    """
+    return tuple(_topological_sort_models(models_to_clone))
+
+
 def _topological_sort_models(
     models_list: List[Type[models.Model]]
 ) -> List[Type[models.Model]]:
@@ -430,7 +769,7 @@ def _topological_sort_models(
     objects that have already been cloned.
 
     Args:
-        models: List of Django model classes to sort
+        models_list: List of Django model classes to sort
 
     Returns:
         List of models sorted in topological order (dependencies first)
@@ -439,95 +778,94 @@ def _topological_sort_models(
         CyclicDependencyError: If circular dependencies exist
 
     Algorithm:
-        Uses Kahn's algorithm for topological sorting:
-        1. Build adjacency list and calculate in-degrees
-        2. Start with models that have no dependencies (in-degree = 0)
-        3. Process each model, removing edges and updating in-degrees
-        4. If we can't process all models, there's a cycle
+        Uses Tarjan's strongly connected components algorithm over foreign key
+        dependencies:
+        1. Visit each model's dependencies depth-first, tracking low-links
+        2. Emit a component once all components it depends on are emitted
+        3. Any component with more than one model is a cycle; every such
+           component is reported with its members
 
     Example:
         If Font has no FKs, Theme references Font, and SiteConfig references Theme:
         Result: [Font, Theme, SiteConfig]
     """
-    # Build dependency graph
-    # graph[model] = list of models that depend on 'model'
-    graph = defaultdict(list)
-
-    # Count of dependencies for each model
-    in_degree = defaultdict(int)
-
-    # Initialize all models with 0 in-degree
-    for model in models_list:
-        in_degree[model] = 0
-
-    # Build the graph by examining foreign key relationships
-    for model in models_list:
-        try:
-            # Get all fields for this model
-            all_fields = model._meta.get_fields()
-        except Exception as e:
-            logger.error(f"Error getting fields for {model.__name__}: {e}")
+    # Number the models 0..M-1 and build the "depends on" adjacency as lists
+    # of node ids, dropping self-references and models we're not cloning
+    node_of = {model: i for i, model in enumerate(models_list)}
+    adjacency = [
+        [
+            node_of[field.related_model]
+            for field in _fk_fields(model)
+            if field.related_model in node_of and field.related_model is not model
+        ]
+        for model in models_list
+    ]
+
+    # Tarjan's strongly connected components over "depends on" edges, run as
+    # an iterative DFS. A component is emitted once every component it depends
+    # on has been emitted, so the emission order is already dependencies-first
+    # and independent models keep their input order.
+    count = len(models_list)
+    index = [-1] * count
+    lowlink = [0] * count
+    on_stack = [False] * count
+    stack = []
+    components = []
+    next_index = 0
+
+    for root in range(count):
+        if index[root] != -1:
             continue
 
-        for field in all_fields:
-            # Skip fields that aren't ForeignKey instances
-            # Use try-except to handle any edge cases
-            try:
-                if not isinstance(field, models.ForeignKey):
-                    continue
-            except Exception as e:
-                logger.warning(
-                    f"Skipping field in {model.__name__} due to error: {e}. "
-                    f"Field type: {type(field)}"
-                )
-                continue
-
-            # Skip self-referential and tenant FKs
-            try:
-                related_model = field.related_model
-            except Exception as e:
-                logger.warning(f"Could not get related_model for field {field.name}: {e}")
-                continue
-
-            if related_model == model or field.name == 'tenant':
-                continue
-
-            # Only consider relationships between models we're cloning
-            if related_model not in models_list:
-                continue
-
-            # model depends on related_model
-            # So related_model must be cloned before model
-            graph[related_model].append(model)
-            in_degree[model] += 1
-
-    # Find all models with no dependencies
-    queue = deque([model for model in models_list if in_degree[model] == 0])
-    sorted_models = []
-
-    # Process models in topological order
-    while queue:
-        # Take a model with no remaining dependencies
-        current = queue.popleft()
-        sorted_models.append(current)
-
-        # Remove edges from current to its dependents
-        for dependent in graph[current]:
-            in_degree[dependent] -= 1
-
-            # If dependent now has no dependencies, add it to queue
-            if in_degree[dependent] == 0:
-                queue.append(dependent)
-
-    # Check if we processed all models
-    if len(sorted_models) != len(models_list):
-        # There's a cycle - find which models are involved
-        remaining = set(models_list) - set(sorted_models)
+        index[root] = lowlink[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(adjacency[root]))]
+
+        while work:
+            current, related_iter = work[-1]
+            for related in related_iter:
+                if index[related] == -1:
+                    index[related] = lowlink[related] = next_index
+                    next_index += 1
+                    stack.append(related)
+                    on_stack[related] = True
+                    work.append((related, iter(adjacency[related])))
+                    break
+                if on_stack[related] and index[related] < lowlink[current]:
+                    lowlink[current] = index[related]
+            else:
+                # All dependencies of current are visited
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[current] < lowlink[parent]:
+                        lowlink[parent] = lowlink[current]
+
+                if lowlink[current] == index[current]:
+                    # current is the root of a component; pop its members
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(models_list[member])
+                        if member == current:
+                            break
+                    components.append(component)
+
+    cycles = [component for component in components if len(component) > 1]
+    if cycles:
         raise CyclicDependencyError(
-            f"Cyclic dependency detected between models: "
-            f"{[m.__name__ for m in remaining]}"
+            "Cyclic dependency detected between models: "
+            + "; ".join(
+                ", ".join(sorted(m.__name__ for m in component))
+                for component in cycles
+            )
         )
 
+    sorted_models = [component[0] for component in components]
+
     return sorted_models
 
 
@@ -547,6 +885,17 @@ def get_all_tenant_models() -> List[Type[models.Model]]:
         >>> for model in tenant_models:
         ...     print(f"Found tenant model: {model.__name__}")
     """
+    return list(_discover_tenant_models())
+
+
+@lru_cache(maxsize=1)
+def _discover_tenant_models() -> tuple:
+    """
+    Scan the app registry for tenant models once.
+
+    The registry is frozen once apps are loaded, so the result is cached for
+    the life of the process.
+    """
     tenant_models = []
 
     for model in apps.get_models():
@@ -555,11 +904,12 @@ def get_all_tenant_models() -> List[Type[models.Model]]:
             continue
 
         # Check if model has a tenant field (i.e., uses TenantMixin)
-        if hasattr(model, '_is_tenant_model') and model._is_tenant_model():
+        is_tenant_model = getattr(model, '_is_tenant_model', None)
+        if is_tenant_model is not None and is_tenant_model():
             tenant_models.append(model)
-            logger.debug(f"Found tenant model: {model.__name__}")
+            logger.debug("Found tenant model: %s", model.__name__)
 
-    return tenant_models
+    return tuple(tenant_models)
 
 
 def clone_all_template_objects(
@@ -567,6 +917,7 @@ def clone_all_template_objects(
     template_tenant=None,
     excluded_models: Optional[List[Type[models.Model]]] = None,
     field_overrides: Optional[Dict[Type[models.Model], Dict[str, Any]]] = None,
+    savepoint: bool = True,
 ) -> Dict[Type[models.Model], Dict[int, models.Model]]:
     """
     Convenience function to clone all template objects for a new tenant.
@@ -582,65 +933,66 @@ def clone_all_template_objects(
         template_tenant: The template tenant to clone from (default: first tenant)
         excluded_models: List of models to skip cloning
         field_overrides: Runtime field overrides per model (applied after model metadata)
+        savepoint: Passed to clone_tenant_objects; only pass False when a clone
+            failure should abort the caller's whole transaction
 
     Returns:
         Dictionary mapping model classes to clone mappings
     """
-    excluded_models = excluded_models or []
+    excluded_models = set(excluded_models or ())
 
     # Get template tenant if not provided
     if template_tenant is None:
-        from .models import Tenant
-        template_tenant = Tenant.objects.order_by("id").first()
-        if template_tenant is None:
+        template_tenant_pk = _get_bootstrap_tenant_pk()
+        if template_tenant_pk is None:
             logger.warning("No template tenant found, nothing to clone")
             return {}
+    else:
+        template_tenant_pk = template_tenant.pk
 
     # Build querysets for all tenant models
     querysets = {}
-    tenant_models = get_all_tenant_models()
+    # The cached tuple itself; get_all_tenant_models() would copy it
+    tenant_models = _discover_tenant_models()
 
     # DEBUG: Log field information for all models
-    logger.debug("=" * 60)
-    logger.debug("DEBUG: Examining fields for all tenant models")
-    logger.debug("=" * 60)
-    for model in tenant_models:
-        logger.debug(f"\n{model.__name__} fields:")
-        try:
-            all_fields = model._meta.get_fields()
-            for field in all_fields:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("=" * 60)
+        logger.debug("DEBUG: Examining fields for all tenant models")
+        logger.debug("=" * 60)
+        for model in tenant_models:
+            logger.debug("\n%s fields:", model.__name__)
+            for field in model._meta.get_fields():
                 logger.debug(
-                    f"  - {getattr(field, 'name', 'NO_NAME')}: {type(field)} "
-                    f"(is FK: {isinstance(field, models.ForeignKey)})"
+                    "  - %s: %s (is FK: %s)",
+                    field.name, type(field), isinstance(field, models.ForeignKey),
                 )
-        except Exception as e:
-            logger.error(f"  ERROR getting fields for {model.__name__}: {e}")
-    logger.debug("=" * 60)
+        logger.debug("=" * 60)
 
     for model in tenant_models:
         if model in excluded_models:
-            logger.info(f"Skipping excluded model: {model.__name__}")
+            logger.info("Skipping excluded model: %s", model.__name__)
+            continue
+
+        if _get_clone_plan(model).mode == 'none':
+            # Never cloned, so don't build a queryset or sort it at all
+            logger.info("Skipping %s - CLONE_MODE='none'", model.__name__)
             continue
 
         # Get template objects for this model
         if hasattr(model, 'get_template_queryset'):
             qs = model.get_template_queryset()
         else:
-            qs = model.objects.filter(tenant=template_tenant)
-
-        if qs.exists():
-            querysets[model] = qs
-            clone_mode = _get_clone_mode(model)
-            logger.info(
-                f"Found {qs.count()} template objects for {model.__name__} "
-                f"(mode: {clone_mode})"
-            )
-        else:
-            logger.info(f"No template objects for {model.__name__} (mode: {_get_clone_mode(model)}); skipping")
+            qs = model.objects.filter(tenant_id=template_tenant_pk)
+        # No exists()/count() pre-scan: an empty queryset simply clones nothing,
+        # so each model costs one SELECT plus its inserts.
+        querysets[model] = qs.only(*_get_clone_only_fields(model))
 
     if not querysets:
         logger.info("No template objects found to clone")
         return {}
 
     # Clone all objects
-    return clone_tenant_objects(querysets, new_tenant, field_overrides)
\ No newline at end of file
+    return clone_tenant_objects(
+        querysets, new_tenant, field_overrides, savepoint=savepoint
+    )
\ No newline at end of file
@@ -1,195 +1,323 @@
 import os
+import re
+import sys
+import time
 import atexit
+import linecache
 import warnings
-import traceback
 import threading
+import weakref
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
 
 # -----------------------------------------------------------------------------
 # Aggregated warning report (debounced + printed once)
 # -----------------------------------------------------------------------------
 
 _TENANCY_WARN_LOCK = threading.Lock()
-_TENANCY_WARN_SEEN = set()    # set[(app_label, model_name, filename, lineno, funcname, line)]
-_TENANCY_WARN_ITEMS = []      # list of dicts (stable order)
+_TENANCY_WARN_CACHE = OrderedDict()  # ("app_label.Model", filename, lineno) -> _WarnItem, LRU order
+_TENANCY_WARN_EVICTED = set()        # keys of sites dropped from the cache (strings and ints only)
+_TENANCY_WARN_MAX_SITES = 1024
+_TENANCY_CALLER_SEEN = set()  # set[(model, code, lineno, code, lineno)]; checked before the walk
+_TENANCY_FAST_SEEN = set()    # set[(model, code, lineno)]; lock-free pre-check
+_TENANCY_PRECHECK_KEYS = {}   # cache key -> pre-check keys answered by it; evicted with the site
 _TENANCY_REPORT_PRINTED = False
 
-_TENANCY_DEBOUNCE_TIMER = None
+_WarnItem = namedtuple("_WarnItem", "model filename lineno funcname")
+
+_TENANCY_DEBOUNCE_THREAD = None
+_TENANCY_DEBOUNCE_DEADLINE = 0.0
 _TENANCY_DEBOUNCE_SECONDS = 1.5  # print summary shortly after warnings stop
 
 
+_MODEL_ID_CACHE = weakref.WeakKeyDictionary()  # model class -> "app_label.ModelName"
+
+
 def _format_model_id(model):
-    return f"{model._meta.app_label}.{model.__name__}"
+    model_id = _MODEL_ID_CACHE.get(model)
+    if model_id is None:
+        model_id = sys.intern(f"{model._meta.app_label}.{model.__name__}")
+        _MODEL_ID_CACHE[model] = model_id
+    return model_id
+
+
+# Trailing separator so a sibling such as ".../tenancy_extra/" never matches the
+# prefix test; paths on different drives simply fail startswith (no ValueError
+# as with os.path.commonpath).
+_TENANCY_DIR = os.path.abspath(os.path.dirname(__file__)) + os.sep
+_DJANGO_RE = re.compile(r"(?:site|dist)-packages[\\/]django[\\/]")
 
 
-def _find_trigger_frame():
+def _find_trigger_frame(start=None):
     """
     Best-effort: find the first stack frame that is not inside the tenancy package,
     and not inside Django internals, so we land on user code.
+
+    Walks frames directly via ``f_back`` from ``start`` (default: above our
+    caller, warn_missing_tenant, which is known tenancy code) and returns the
+    raw frame object (or None), instead of materialising the whole stack.
     """
-    stack = traceback.extract_stack()
-    tenancy_dir = os.path.abspath(os.path.dirname(__file__))
-    trigger = None
+    frame = start if start is not None else sys._getframe(2)
 
-    for frame in reversed(stack):
-        filename = os.path.abspath(frame.filename)
+    while frame is not None:
+        filename = frame.f_code.co_filename
 
         # Skip frames inside tenancy package
-        try:
-            if os.path.commonpath([tenancy_dir, filename]) == tenancy_dir:
-                continue
-        except ValueError:
-            pass
+        if filename.startswith(_TENANCY_DIR):
+            frame = frame.f_back
+            continue
 
         # Skip Django internals
-        if "site-packages" in filename and (os.sep + "django" + os.sep) in filename:
+        if _DJANGO_RE.search(filename):
+            frame = frame.f_back
             continue
 
-        trigger = frame
-        break
-
-    return trigger
-
-
-def _build_summary_text(items):
-    header = (
-        "\n"
-        "==================== TENANCY WARNING SUMMARY ====================\n"
-        "Tenant was None while querying tenant-scoped models.\n"
-        "These querysets were forced to .none() for safety.\n"
-        "\n"
-        "Unique triggers:\n"
-    )
-
-    body_lines = []
-    for i, item in enumerate(items, start=1):
-        body_lines.append(
-            f"  {i}. {_format_model_id(item['model'])}\n"
-            f"     {item['filename']}:{item['lineno']} in {item['funcname']}\n"
-            f"     {item['line']}\n"
-        )
-
-    instructions = (
-        "\n"
-        "Canonical Django fixes:\n"
-        "\n"
-        "CASE 1: Explicit form fields declared at import time\n"
-        "--------------------------------------------------\n"
-        "  class MyForm(forms.Form):\n"
-        "      person = forms.ModelChoiceField(queryset=Person.objects.none())\n"
-        "\n"
-        "      def __init__(self, *args, **kwargs):\n"
-        "          super().__init__(*args, **kwargs)\n"
-        "          self.fields['person'].queryset = Person.objects.all()\n"
-        "\n"
-        "CASE 2: ModelForm relationship fields (FK / M2M)\n"
-        "--------------------------------------------------\n"
-        "  class MyModelForm(forms.ModelForm):\n"
-        "      related = forms.ModelChoiceField(\n"
-        "          queryset=Person.objects.all_tenants().none()\n"
-        "      )\n"
-        "\n"
-        "      class Meta:\n"
-        "          model = MyModel\n"
-        "          fields = ['related', ...]\n"
-        "\n"
-        "      def __init__(self, *args, **kwargs):\n"
-        "          super().__init__(*args, **kwargs)\n"
-        "          self.fields['related'].queryset = Person.objects.all()\n"
-        "\n"
-        "Explanation:\n"
-        "  ModelForm auto-generates relationship fields at import time.\n"
-        "  Overriding them with an EMPTY placeholder queryset prevents\n"
-        "  tenant evaluation before runtime.\n"
-        "===============================================================\n"
-    )
-
-    return header + "\n".join(body_lines) + instructions
-
-
+        return frame
+
+    return None
+
+
+_SUMMARY_HEADER = (
+    "\n"
+    "==================== TENANCY WARNING SUMMARY ====================\n"
+    "Tenant was None while querying tenant-scoped models.\n"
+    "These querysets were forced to .none() for safety.\n"
+    "\n"
+    "Unique triggers:\n"
+)
+
+_SUMMARY_INSTRUCTIONS = (
+    "\n"
+    "Canonical Django fixes:\n"
+    "\n"
+    "CASE 1: Explicit form fields declared at import time\n"
+    "--------------------------------------------------\n"
+    "  class MyForm(forms.Form):\n"
+    "      person = forms.ModelChoiceField(queryset=Person.objects.none())\n"
+    "\n"
+    "      def __init__(self, *args, **kwargs):\n"
+    "          super().__init__(*args, **kwargs)\n"
+    "          self.fields['person'].queryset = Person.objects.all()\n"
+    "\n"
+    "CASE 2: ModelForm relationship fields (FK / M2M)\n"
+    "--------------------------------------------------\n"
+    "  class MyModelForm(forms.ModelForm):\n"
+    "      related = forms.ModelChoiceField(\n"
+    "          queryset=Person.objects.all_tenants().none()\n"
+    "      )\n"
+    "\n"
+    "      class Meta:\n"
+    "          model = MyModel\n"
+    "          fields = ['related', ...]\n"
+    "\n"
+    "      def __init__(self, *args, **kwargs):\n"
+    "          super().__init__(*args, **kwargs)\n"
+    "          self.fields['related'].queryset = Person.objects.all()\n"
+    "\n"
+    "Explanation:\n"
+    "  ModelForm auto-generates relationship fields at import time.\n"
+    "  Overriding them with an EMPTY placeholder queryset prevents\n"
+    "  tenant evaluation before runtime.\n"
+    "===============================================================\n"
+)
+
+
+def _build_summary_text(items, evicted=0):
+    body_lines = [
+        f"  {i}. {_format_model_id(item.model)}\n"
+        f"     {item.filename}:{item.lineno} in {item.funcname}\n"
+        f"     {linecache.getline(item.filename, item.lineno).strip()}\n"
+        for i, item in enumerate(items, start=1)
+    ]
+    if evicted:
+        body_lines.append(f"  ... and {evicted} older trigger(s) elided\n")
+
+    return _SUMMARY_HEADER + "\n".join(body_lines) + _SUMMARY_INSTRUCTIONS
+
+
+@atexit.register
 def _print_summary_once():
     """
     Print the consolidated summary exactly once per process run.
+
+    Registered with atexit at import as the fallback for the debounce worker
+    (and the only trigger when TENANCY_WARNING_SUMMARY = 'atexit').
     """
     global _TENANCY_REPORT_PRINTED
 
     with _TENANCY_WARN_LOCK:
         if _TENANCY_REPORT_PRINTED:
             return
-        if not _TENANCY_WARN_ITEMS:
+        if not _TENANCY_WARN_CACHE:
             return
 
         _TENANCY_REPORT_PRINTED = True
-        text = _build_summary_text(_TENANCY_WARN_ITEMS)
+        text = _build_summary_text(
+            list(_TENANCY_WARN_CACHE.values()), len(_TENANCY_WARN_EVICTED)
+        )
+
+    # warn_explicit: the location is fixed, so there is no stack to walk. Line 0
+    # because the summary belongs to no particular line of this module.
+    warnings.warn_explicit(text, RuntimeWarning, __file__, 0, module=__name__)
 
-    warnings.warn(text, RuntimeWarning, stacklevel=1)
+
+def _debounce_loop():
+    """
+    Sleep until the debounce deadline stops moving, then print the summary.
+    """
+    while True:
+        remaining = _TENANCY_DEBOUNCE_DEADLINE - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(remaining)
+
+    _print_summary_once()
 
 
 def _schedule_debounced_summary():
     """
     Debounce printing so we emit one summary shortly after the flurry of warnings ends.
+
+    A single worker thread is started on the first call; later calls only push
+    its deadline back. Callers hold _TENANCY_WARN_LOCK.
     """
-    global _TENANCY_DEBOUNCE_TIMER
+    global _TENANCY_DEBOUNCE_THREAD, _TENANCY_DEBOUNCE_DEADLINE
 
-    def _timer_fn():
-        # Print summary after debounce window
-        _print_summary_once()
+    _TENANCY_DEBOUNCE_DEADLINE = time.monotonic() + _TENANCY_DEBOUNCE_SECONDS
 
-    # Cancel any existing pending timer and reschedule
-    if _TENANCY_DEBOUNCE_TIMER is not None:
-        try:
-            _TENANCY_DEBOUNCE_TIMER.cancel()
-        except Exception:
-            pass
+    if _TENANCY_DEBOUNCE_THREAD is None:
+        _TENANCY_DEBOUNCE_THREAD = threading.Thread(
+            target=_debounce_loop, name="tenancy-warning-summary", daemon=True
+        )
+        _TENANCY_DEBOUNCE_THREAD.start()
 
-    _TENANCY_DEBOUNCE_TIMER = threading.Timer(_TENANCY_DEBOUNCE_SECONDS, _timer_fn)
-    _TENANCY_DEBOUNCE_TIMER.daemon = True
-    _TENANCY_DEBOUNCE_TIMER.start()
+
+def _runtime_warnings_ignored():
+    """
+    True when the active warnings filters blanket-ignore RuntimeWarning, so
+    nothing we would emit could be seen.
+
+    Only an unconditional filter (no message/module pattern, any line) decides
+    the outcome; a narrower matching filter is treated as "maybe shown".
+    """
+    for action, message, category, module, lineno in warnings.filters:
+        if not issubclass(RuntimeWarning, category):
+            continue
+        if message is None and module is None and not lineno:
+            return action == "ignore"
+        return False
+    return False
 
 
-# Also print at process exit as a fallback
-atexit.register(_print_summary_once)
+def _remember_precheck_keys(key, precheck_keys):
+    """
+    Record pre-check keys that now answer for cached site ``key``, so evicting
+    the site drops them too. Callers hold _TENANCY_WARN_LOCK.
+    """
+    _TENANCY_PRECHECK_KEYS.setdefault(key, []).extend(precheck_keys)
+    for precheck_key in precheck_keys:
+        if len(precheck_key) == 3:
+            _TENANCY_FAST_SEEN.add(precheck_key)
+        else:
+            _TENANCY_CALLER_SEEN.add(precheck_key)
 
 
-def warn_missing_tenant(model):
+def warn_missing_tenant(model, caller_frame=None):
     """
     Aggregate missing-tenant warnings and print a single summary shortly after startup.
     Still non-fatal; execution continues.
+
+    Callers that know where they were invoked from can pass ``caller_frame``
+    (e.g. ``sys._getframe(1)``) so the trigger search starts there instead of
+    at the top of the stack.
     """
-    trigger = _find_trigger_frame()
-    if trigger:
-        filename = trigger.filename
-        lineno = trigger.lineno
-        funcname = trigger.name
-        line = (trigger.line or "").strip()
+    # Filters can change at runtime (-W, catch_warnings, test runners), so this
+    # is checked per call; it scans a handful of entries, far less than a stack walk.
+    if _runtime_warnings_ignored():
+        return
+
+    caller = caller_frame if caller_frame is not None else sys._getframe(1)
+    caller_back = caller.f_back
+
+    # First level, before any stack walk: the caller and its caller. It is only
+    # recorded below when the trigger turned out to be one of these two frames,
+    # so a hit always means the same trigger; deeper triggers (e.g. through
+    # Django's manager proxies, shared by every call site) fall through.
+    caller_key = (
+        model,
+        caller.f_code,
+        caller.f_lineno,
+        caller_back.f_code if caller_back is not None else None,
+        caller_back.f_lineno if caller_back is not None else 0,
+    )
+    if caller_key in _TENANCY_CALLER_SEEN:
+        return
+
+    trigger = _find_trigger_frame(caller)
+    caller_is_trigger = trigger is not None and (trigger is caller or trigger is caller_back)
+
+    # Second level: repeat triggers are by far the common case, so answer them
+    # from a plain set (contains is atomic under the GIL) before locking. Both
+    # pre-check sets only hold keys of sites still in the cache.
+    if trigger is not None:
+        fast_key = (model, trigger.f_code, trigger.f_lineno)
+    else:
+        fast_key = (model, None, 0)
+    if fast_key in _TENANCY_FAST_SEEN:
+        if caller_is_trigger:
+            key = (_format_model_id(model), trigger.f_code.co_filename, trigger.f_lineno)
+            with _TENANCY_WARN_LOCK:
+                if key in _TENANCY_WARN_CACHE:
+                    _remember_precheck_keys(key, (caller_key,))
+        return
+
+    precheck_keys = (fast_key, caller_key) if caller_is_trigger else (fast_key,)
+
+    if trigger is not None:
+        filename = sys.intern(trigger.f_code.co_filename)
+        lineno = trigger.f_lineno
+        funcname = trigger.f_code.co_name
     else:
         filename = "unknown"
         lineno = 0
         funcname = "unknown"
-        line = ""
 
-    key = (model._meta.app_label, model.__name__, filename, lineno, funcname, line)
+    # file:lineno already identifies a site; funcname adds nothing
+    key = (_format_model_id(model), filename, lineno)
+
+    item = _WarnItem(model, filename, lineno, funcname)
 
     with _TENANCY_WARN_LOCK:
-        if key in _TENANCY_WARN_SEEN:
+        # One hashed lookup both tests for and records the site
+        if _TENANCY_WARN_CACHE.setdefault(key, item) is not item:
+            _TENANCY_WARN_CACHE.move_to_end(key)
+            _remember_precheck_keys(key, precheck_keys)
             return
 
-        _TENANCY_WARN_SEEN.add(key)
-        _TENANCY_WARN_ITEMS.append(
-            {
-                "model": model,
-                "filename": filename,
-                "lineno": lineno,
-                "funcname": funcname,
-                "line": line,
-            }
-        )
-
-        # Optional: short one-liner immediately for each new unique trigger
-        warnings.warn(
+        _remember_precheck_keys(key, precheck_keys)
+        # A site that comes back after eviction is listed again, not elided
+        _TENANCY_WARN_EVICTED.discard(key)
+        if len(_TENANCY_WARN_CACHE) > _TENANCY_WARN_MAX_SITES:
+            evicted_key, _ = _TENANCY_WARN_CACHE.popitem(last=False)
+            _TENANCY_WARN_EVICTED.add(evicted_key)
+            for precheck_key in _TENANCY_PRECHECK_KEYS.pop(evicted_key, ()):
+                _TENANCY_FAST_SEEN.discard(precheck_key)
+                _TENANCY_CALLER_SEEN.discard(precheck_key)
+
+        # Schedule one consolidated report soon, unless the project only
+        # wants it at process exit
+        if getattr(settings, "TENANCY_WARNING_SUMMARY", "debounce") != "atexit":
+            _schedule_debounced_summary()
+
+    # Optional: short one-liner immediately for each new unique trigger.
+    # Emitted outside the lock, and attributed to the trigger frame we already
+    # found rather than letting warnings.warn walk the stack again.
+    if getattr(settings, "TENANCY_WARNING_IMMEDIATE", False):
+        warnings.warn_explicit(
             f"[tenancy warning] queued: {_format_model_id(model)} at {filename}:{lineno}",
             RuntimeWarning,
-            stacklevel=2,
+            filename,
+            lineno,
+            module=trigger.f_globals.get("__name__") if trigger is not None else None,
         )
-
-        # Schedule one consolidated report soon
-        _schedule_debounced_summary()